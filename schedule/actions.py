@@ -0,0 +1,81 @@
+"""Aksi bersama untuk view HTML dan API JSON (perubahan status + notifikasi + statistik)."""
+from __future__ import annotations
+from datetime import timedelta
+
+from django.db import transaction
+from django.utils import timezone
+
+from . import analytics
+from .models import Notification, ScheduleApplication, ShootingSchedule, SocialMediaTask, User
+
+
+# Field yang perubahannya perlu diberitahukan ke peserta jadwal.
+NOTIFY_FIELDS = ('date', 'time', 'location')
+# Edit beruntun dalam jendela ini digabung menjadi satu notifikasi (yang belum dibaca).
+CHANGE_COALESCE_WINDOW = timedelta(minutes=10)
+
+RESPONSE_LABELS = {
+    'confirmed': 'diterima',
+    'rejected': 'ditolak',
+}
+
+
+def apply_to_schedule(schedule: ShootingSchedule, actor: User) -> ScheduleApplication:
+    application = ScheduleApplication.objects.create(schedule=schedule, actor=actor, status='pending')
+    analytics.record_application(application)
+    Notification.objects.create(user=schedule.producer, schedule=schedule, message=f'Aktor {actor.get_full_name() or actor.username} mengajukan untuk bergabung jadwal "{schedule.title}".')
+    return application
+
+
+def withdraw_application(application: ScheduleApplication) -> None:
+    application.delete()
+    analytics.record_application(application, delta=-1)
+
+
+def respond_to_application(application: ScheduleApplication, status: str) -> ScheduleApplication:
+    previous_status, previous_responded_at = application.status, application.responded_at
+    application.status = status
+    application.responded_at = timezone.now()
+    application.save(update_fields=['status', 'responded_at', 'updated_at'])
+    analytics.record_response(application, previous_status, previous_responded_at)
+    Notification.objects.create(user=application.actor, schedule=application.schedule, message=f'Pengajuan Anda pada "{application.schedule.title}" {RESPONSE_LABELS[status]}.')
+    return application
+
+
+def complete_task(task: SocialMediaTask) -> SocialMediaTask:
+    task.is_completed = True
+    task.completed_at = timezone.now()
+    task.save(update_fields=['is_completed', 'completed_at', 'updated_at'])
+    analytics.record_task_completed(task)
+    return task
+
+
+def notify_schedule_change(schedule_id: int) -> int:
+    """Beri tahu aktor terkonfirmasi dan editor task bahwa jadwal berubah.
+
+    Notifikasi perubahan yang belum dibaca dan masih dalam jendela coalesce
+    diperbarui di tempat; penerima lain mendapat notifikasi baru via satu `bulk_create`.
+    """
+    schedule = ShootingSchedule.objects.filter(pk=schedule_id).only('title', 'date', 'time', 'location').first()
+    if schedule is None:
+        return 0
+    recipients = set(
+        ScheduleApplication.objects.filter(schedule_id=schedule_id, status='confirmed').order_by().values_list('actor_id', flat=True)
+        .union(SocialMediaTask.objects.filter(schedule_id=schedule_id, editor__isnull=False).order_by().values_list('editor_id', flat=True))
+    )
+    if not recipients:
+        return 0
+    now = timezone.now()
+    message = f'Jadwal "{schedule.title}" diperbarui: sekarang {schedule.date:%d-%m-%Y} jam {schedule.time:%H:%M} di {schedule.location}.'
+    with transaction.atomic():
+        pending = Notification.objects.filter(
+            schedule_id=schedule_id, kind='schedule_change', is_read=False,
+            created_at__gte=now - CHANGE_COALESCE_WINDOW, user_id__in=recipients,
+        )
+        coalesced = set(pending.values_list('user_id', flat=True))
+        pending.update(message=message, created_at=now)
+        Notification.objects.bulk_create(
+            Notification(user_id=user_id, schedule_id=schedule_id, kind='schedule_change', message=message)
+            for user_id in recipients - coalesced
+        )
+    return len(recipients)
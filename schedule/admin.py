@@ -1,43 +1,181 @@
-from django.contrib import admin
+from django.contrib import admin, messages
+from django.contrib.admin.views.main import PAGE_VAR
 from django.contrib.auth.admin import UserAdmin as DjangoUserAdmin
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils import timezone
+from django.utils.functional import cached_property
+from .analytics import record_trail
 from .models import User, ShootingSchedule, Notification, ScheduleApplication, SocialMediaTask
 
 
+class ApproximateCountPaginator(Paginator):
+    """Paginator yang tidak menjalankan COUNT(*) penuh pada tabel besar.
+
+    COUNT dibatasi `COUNT_LIMIT` baris, atau sampai satu halaman setelah halaman
+    yang dibuka (`page_hint`) agar halaman berikutnya selalu bisa dituju. Jika
+    batas tercapai tanpa filter, dipakai statistik database bila lebih besar.
+    Statistik yang kosong/basi tidak pernah menyembunyikan baris.
+    """
+    COUNT_LIMIT = 10000
+
+    def __init__(self, *args, page_hint: int = 1, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.page_hint = max(page_hint, 1)
+
+    @cached_property
+    def count(self) -> int:
+        qs = self.object_list
+        limit = max(self.COUNT_LIMIT, (self.page_hint + 1) * self.per_page + 1)
+        counted = qs.order_by().values('pk')[:limit].count()
+        if counted < limit or qs.query.where:
+            return counted
+        return max(counted, self._estimate(qs) or 0)
+
+    def _estimate(self, qs) -> int | None:
+        table = qs.model._meta.db_table
+        connection = connections[qs.db]
+        queries = {
+            'postgresql': ('SELECT reltuples::bigint FROM pg_class WHERE relname = %s', [table]),
+            'mysql': ('SELECT table_rows FROM information_schema.tables WHERE table_schema = DATABASE() AND table_name = %s', [table]),
+            # Hanya tersedia setelah `ANALYZE` dijalankan.
+            'sqlite': ('SELECT stat FROM sqlite_stat1 WHERE tbl = %s LIMIT 1', [table]),
+        }
+        if connection.vendor not in queries:
+            return None
+        sql, params = queries[connection.vendor]
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute(sql, params)
+                row = cursor.fetchone()
+        except Exception:
+            return None
+        if not row or row[0] is None:
+            return None
+        return int(str(row[0]).split()[0])
+
+
+class ScalableAdminMixin:
+    paginator = ApproximateCountPaginator
+    show_full_result_count = False
+    list_per_page = 50
+
+    def get_paginator(self, request, queryset, per_page, orphans=0, allow_empty_first_page=True):
+        try:
+            page_hint = int(request.GET.get(PAGE_VAR, 1))
+        except ValueError:
+            page_hint = 1
+        return self.paginator(queryset, per_page, orphans, allow_empty_first_page, page_hint=page_hint)
+
+    def _bulk_update(self, request, queryset, message: str, **values) -> None:
+        # Satu UPDATE untuk seluruh pilihan, tanpa memuat objek satu per satu.
+        updated = queryset.order_by().update(**values)
+        self.message_user(request, f'{updated} {message}', messages.SUCCESS)
+
+
 @admin.register(User)
-class UserAdmin(DjangoUserAdmin):
+class UserAdmin(ScalableAdminMixin, DjangoUserAdmin):
     fieldsets = DjangoUserAdmin.fieldsets + (
         ('Additional Info', {'fields': ('role', 'phone')}),
     )
     list_display = ('username', 'email', 'first_name', 'last_name', 'role', 'phone', 'is_staff')
     list_filter = ('role', 'is_staff', 'is_superuser', 'is_active')
     search_fields = ('username', 'email', 'first_name', 'last_name', 'phone')
+    date_hierarchy = 'date_joined'
+    actions = ('activate_users', 'deactivate_users')
+
+    @admin.action(description='Aktifkan user terpilih')
+    def activate_users(self, request, queryset):
+        self._bulk_update(request, queryset.filter(is_active=False), 'user diaktifkan.', is_active=True)
+
+    @admin.action(description='Nonaktifkan user terpilih')
+    def deactivate_users(self, request, queryset):
+        self._bulk_update(request, queryset.filter(is_active=True), 'user dinonaktifkan.', is_active=False)
 
 
 @admin.register(ShootingSchedule)
-class ShootingScheduleAdmin(admin.ModelAdmin):
+class ShootingScheduleAdmin(ScalableAdminMixin, admin.ModelAdmin):
     list_display = ('title', 'date', 'time', 'status', 'producer', 'location')
     list_filter = ('status', 'date')
+    list_select_related = ('producer',)
     search_fields = ('title', 'location', 'producer__username', 'producer__first_name', 'producer__last_name')
     autocomplete_fields = ('producer',)
+    readonly_fields = ('script_version',)
+    date_hierarchy = 'date'
+    actions = ('mark_closed', 'mark_completed')
+
+    @admin.action(description='Tutup pendaftaran jadwal terpilih')
+    def mark_closed(self, request, queryset):
+        self._bulk_update(request, queryset.filter(status='available'), 'jadwal ditutup.',
+                          status='closed', updated_at=timezone.now())
+
+    @admin.action(description='Tandai jadwal terpilih selesai')
+    def mark_completed(self, request, queryset):
+        self._bulk_update(request, queryset.exclude(status='completed'), 'jadwal ditandai selesai.',
+                          status='completed', updated_at=timezone.now())
 
 
 @admin.register(ScheduleApplication)
-class ScheduleApplicationAdmin(admin.ModelAdmin):
+class ScheduleApplicationAdmin(ScalableAdminMixin, admin.ModelAdmin):
     list_display = ('schedule', 'actor', 'status', 'submitted_at', 'responded_at')
     list_filter = ('status', 'submitted_at')
+    list_select_related = ('schedule', 'actor')
     search_fields = ('schedule__title', 'actor__username', 'actor__first_name', 'actor__last_name')
+    autocomplete_fields = ('schedule', 'actor')
+    date_hierarchy = 'submitted_at'
+    actions = ('confirm_applications', 'reject_applications')
+
+    # Ringkasan statistik disusulkan oleh `refresh_stats` (baris dengan updated_at baru).
+    # Respons lama dicatat dulu agar hari respons sebelumnya ikut dihitung ulang.
+    @admin.action(description='Terima pengajuan terpilih')
+    def confirm_applications(self, request, queryset):
+        now = timezone.now()
+        queryset = queryset.exclude(status='confirmed')
+        record_trail(queryset)
+        self._bulk_update(request, queryset, 'pengajuan diterima.',
+                          status='confirmed', responded_at=now, updated_at=now)
+
+    @admin.action(description='Tolak pengajuan terpilih')
+    def reject_applications(self, request, queryset):
+        now = timezone.now()
+        queryset = queryset.exclude(status='rejected')
+        record_trail(queryset)
+        self._bulk_update(request, queryset, 'pengajuan ditolak.',
+                          status='rejected', responded_at=now, updated_at=now)
 
 
 @admin.register(SocialMediaTask)
-class SocialMediaTaskAdmin(admin.ModelAdmin):
+class SocialMediaTaskAdmin(ScalableAdminMixin, admin.ModelAdmin):
     list_display = ('film_title', 'social_media', 'editor', 'due_date', 'is_completed')
-    list_filter = ('social_media', 'is_completed', 'due_date', 'schedule')
+    # Filter per jadwal diganti pencarian: RelatedFieldListFilter memuat semua jadwal.
+    list_filter = ('social_media', 'is_completed', 'due_date')
+    list_select_related = ('editor',)
     search_fields = ('film_title', 'caption', 'schedule__title', 'editor__username')
     autocomplete_fields = ('schedule', 'editor')
+    date_hierarchy = 'due_date'
+    actions = ('mark_completed',)
+
+    @admin.action(description='Tandai task terpilih selesai')
+    def mark_completed(self, request, queryset):
+        now = timezone.now()
+        self._bulk_update(request, queryset.filter(is_completed=False), 'task ditandai selesai.',
+                          is_completed=True, completed_at=now, updated_at=now)
 
 
 @admin.register(Notification)
-class NotificationAdmin(admin.ModelAdmin):
+class NotificationAdmin(ScalableAdminMixin, admin.ModelAdmin):
     list_display = ('user', 'schedule', 'message', 'is_read', 'created_at')
-    list_filter = ('is_read', 'created_at')
+    list_filter = ('kind', 'is_read', 'created_at')
+    list_select_related = ('user', 'schedule')
     search_fields = ('user__username', 'message', 'schedule__title')
+    autocomplete_fields = ('user', 'schedule')
+    date_hierarchy = 'created_at'
+    actions = ('mark_read', 'mark_unread')
+
+    @admin.action(description='Tandai notifikasi terpilih sudah dibaca')
+    def mark_read(self, request, queryset):
+        self._bulk_update(request, queryset.filter(is_read=False), 'notifikasi ditandai dibaca.', is_read=True)
+
+    @admin.action(description='Tandai notifikasi terpilih belum dibaca')
+    def mark_unread(self, request, queryset):
+        self._bulk_update(request, queryset.filter(is_read=True), 'notifikasi ditandai belum dibaca.', is_read=False)
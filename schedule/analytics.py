@@ -0,0 +1,293 @@
+"""Pemeliharaan inkremental tabel ringkasan casting (`ScheduleStats`, `DailyStats`).
+
+View memanggil fungsi `record_*` pada jalur join/leave/approve/reject/complete,
+sehingga halaman analitik cukup membaca tabel ringkasan. Perubahan yang tidak
+lewat view (admin, shell, bulk update) disusulkan oleh `refresh_stats` lewat
+`updated_at` pengajuan; nilai lama pengajuan yang dihapus atau responnya diubah
+dicatat di `ApplicationTrail` oleh receiver di bawah (dan `record_trail` untuk update massal).
+"""
+from __future__ import annotations
+from datetime import datetime, timedelta
+from typing import Iterable
+
+from django.db import transaction
+from django.db.models import Count, F, Q, Sum
+from django.db.models.signals import post_delete, pre_save
+from django.dispatch import receiver
+from django.db.models.functions import Greatest, TruncDate
+from django.utils import timezone
+
+from .models import (
+    ArchivedApplication, ArchivedSchedule, ArchivedScheduleStats, ArchivedSocialMediaTask,
+    ApplicationTrail, DailyStats, ScheduleApplication, ScheduleStats, ShootingSchedule, SocialMediaTask, Watermark,
+)
+
+
+RESPONDED_STATUSES = ('confirmed', 'rejected')
+COUNTER_FIELDS = ('applicants', 'confirmed', 'rejected', 'response_seconds', 'tasks_completed', 'task_seconds')
+CHUNK_SIZE = 500
+# (jadwal, pengajuan, task, ringkasan per jadwal) untuk tabel aktif dan tabel arsip.
+LIVE_TABLES = (ShootingSchedule, ScheduleApplication, SocialMediaTask, ScheduleStats)
+ARCHIVED_TABLES = (ArchivedSchedule, ArchivedApplication, ArchivedSocialMediaTask, ArchivedScheduleStats)
+TRAIL_CONSUMERS = ('stats', 'recommendations')
+
+
+def _seconds(delta: timedelta | None) -> int:
+    return int(delta.total_seconds()) if delta else 0
+
+
+def _expressions(deltas: dict[str, int]) -> dict:
+    # Penurunan dijaga agar tidak negatif bila ringkasan belum pernah di-backfill.
+    return {
+        field: F(field) + value if value >= 0 else Greatest(F(field) + value, 0)
+        for field, value in deltas.items() if value
+    }
+
+
+def _bump(schedule_id: int, producer_id: int, day, **deltas: int) -> None:
+    updates = _expressions(deltas)
+    if not updates:
+        return
+    with transaction.atomic():
+        ScheduleStats.objects.get_or_create(schedule_id=schedule_id, defaults={'producer_id': producer_id})
+        ScheduleStats.objects.filter(schedule_id=schedule_id).update(updated_at=timezone.now(), **updates)
+        DailyStats.objects.get_or_create(producer_id=producer_id, day=day)
+        DailyStats.objects.filter(producer_id=producer_id, day=day).update(**updates)
+
+
+def _response_deltas(status: str, seconds: int, sign: int) -> dict[str, int]:
+    return {status: sign, 'response_seconds': sign * seconds}
+
+
+def record_application(application: ScheduleApplication, delta: int = 1) -> None:
+    """Catat pengajuan baru (`delta=1`) atau pengajuan yang dibatalkan (`delta=-1`)."""
+    _bump(
+        application.schedule_id,
+        application.schedule.producer_id,
+        timezone.localdate(application.submitted_at),
+        applicants=delta,
+    )
+
+
+def record_response(application: ScheduleApplication, previous_status: str, previous_responded_at: datetime | None) -> None:
+    """Catat approve/reject; respons sebelumnya (jika ada) dibatalkan lebih dulu."""
+    producer_id = application.schedule.producer_id
+    if previous_status in RESPONDED_STATUSES and previous_responded_at:
+        seconds = _seconds(previous_responded_at - application.submitted_at)
+        _bump(application.schedule_id, producer_id, timezone.localdate(previous_responded_at),
+              **_response_deltas(previous_status, seconds, -1))
+    seconds = _seconds(application.responded_at - application.submitted_at)
+    _bump(application.schedule_id, producer_id, timezone.localdate(application.responded_at),
+          **_response_deltas(application.status, seconds, 1))
+
+
+def record_task_completed(task: SocialMediaTask) -> None:
+    _bump(
+        task.schedule_id,
+        task.schedule.producer_id,
+        timezone.localdate(task.completed_at),
+        tasks_completed=1,
+        task_seconds=_seconds(task.completed_at - task.created_at),
+    )
+
+
+def record_trail(applications) -> None:
+    """Catat nilai lama pengajuan yang sudah direspons, sebelum `QuerySet.update()` massal."""
+    ApplicationTrail.objects.bulk_create(
+        ApplicationTrail(schedule_id=schedule_id, actor_id=actor_id, submitted_at=submitted_at, responded_at=responded_at)
+        for schedule_id, actor_id, submitted_at, responded_at in applications.filter(responded_at__isnull=False)
+        .order_by().values_list('schedule_id', 'actor_id', 'submitted_at', 'responded_at')
+    )
+
+
+@receiver(pre_save, sender=ScheduleApplication, dispatch_uid='analytics_application_changed')
+def application_changed(sender, instance: ScheduleApplication, **kwargs) -> None:
+    loaded = getattr(instance, '_loaded_response', None)
+    if loaded is None or loaded == (instance.status, instance.responded_at):
+        return
+    status, responded_at = loaded
+    if responded_at is not None:
+        ApplicationTrail.objects.create(
+            schedule_id=instance.schedule_id, actor_id=instance.actor_id,
+            submitted_at=instance.submitted_at, responded_at=responded_at,
+        )
+    instance._loaded_response = (instance.status, instance.responded_at)
+
+
+@receiver(post_delete, sender=ScheduleApplication, dispatch_uid='analytics_application_deleted')
+def application_deleted(sender, instance: ScheduleApplication, **kwargs) -> None:
+    ApplicationTrail.objects.create(
+        schedule_id=instance.schedule_id, actor_id=instance.actor_id,
+        submitted_at=instance.submitted_at, responded_at=instance.responded_at,
+    )
+
+
+def purge_trail() -> int:
+    """Hapus jejak yang sudah diproses oleh semua pemakainya (watermark `stats` dan `recommendations`).
+
+    Pemakai yang belum pernah berjalan akan memulai dengan mode penuh, jadi tidak perlu ditunggu.
+    """
+    marks = Watermark.objects.filter(name__in=TRAIL_CONSUMERS).values_list('value', flat=True)
+    cutoff = min(marks, default=None)
+    trail = ApplicationTrail.objects.all() if cutoff is None else ApplicationTrail.objects.filter(recorded_at__lt=cutoff)
+    return trail.delete()[0]
+
+
+def _chunks(values: list, size: int = CHUNK_SIZE) -> Iterable[list]:
+    for i in range(0, len(values), size):
+        yield values[i:i + size]
+
+
+def _day_range(field: str, days: list) -> Q:
+    # Batas datetime agar filter tetap memakai indeks sebelum TruncDate dievaluasi.
+    start = timezone.make_aware(datetime.combine(days[0], datetime.min.time()))
+    end = timezone.make_aware(datetime.combine(days[-1] + timedelta(days=1), datetime.min.time()))
+    return Q(**{f'{field}__gte': start, f'{field}__lt': end})
+
+
+def rebuild_schedule_stats(schedule_ids: Iterable[int], archived: bool = False) -> int:
+    """Hitung ulang `ScheduleStats` (atau `ArchivedScheduleStats`) hanya untuk jadwal yang disebutkan."""
+    schedule_model, application_model, task_model, stats_model = ARCHIVED_TABLES if archived else LIVE_TABLES
+    ids = sorted(set(schedule_ids))
+    response_expr = F('responded_at') - F('submitted_at')
+    for chunk in _chunks(ids):
+        rows = {
+            pk: dict.fromkeys(COUNTER_FIELDS, 0) | {'producer_id': producer_id}
+            for pk, producer_id in schedule_model.objects.filter(id__in=chunk).values_list('id', 'producer_id')
+        }
+        apps = (
+            application_model.objects.filter(schedule_id__in=chunk)
+            .values('schedule_id')
+            .annotate(
+                applicants=Count('id'),
+                confirmed=Count('id', filter=Q(status='confirmed', responded_at__isnull=False)),
+                rejected=Count('id', filter=Q(status='rejected', responded_at__isnull=False)),
+                response=Sum(response_expr, filter=Q(status__in=RESPONDED_STATUSES, responded_at__isnull=False)),
+            )
+        )
+        for a in apps:
+            rows[a['schedule_id']].update(
+                applicants=a['applicants'], confirmed=a['confirmed'], rejected=a['rejected'],
+                response_seconds=_seconds(a['response']),
+            )
+        tasks = (
+            task_model.objects.filter(schedule_id__in=chunk, is_completed=True, completed_at__isnull=False)
+            .values('schedule_id')
+            .annotate(done=Count('id'), latency=Sum(F('completed_at') - F('created_at')))
+        )
+        for t in tasks:
+            rows[t['schedule_id']].update(tasks_completed=t['done'], task_seconds=_seconds(t['latency']))
+        with transaction.atomic():
+            stats_model.objects.filter(schedule_id__in=chunk).delete()
+            stats_model.objects.bulk_create(
+                stats_model(schedule_id=pk, **values) for pk, values in rows.items()
+            )
+    return len(ids)
+
+
+def rebuild_daily_stats(days: Iterable, replace_all: bool = False) -> int:
+    """Hitung ulang `DailyStats` untuk tanggal (lokal) yang disebutkan, semua produser.
+
+    Dengan `replace_all`, baris hari lain ikut dihapus (bangun ulang penuh).
+    """
+    days = sorted(set(days))
+    if not days and not replace_all:
+        return 0
+    tz = timezone.get_current_timezone()
+    rows: dict[tuple[int, object], dict[str, int]] = {}
+
+    def row(producer_id: int, day) -> dict[str, int]:
+        return rows.setdefault((producer_id, day), dict.fromkeys(COUNTER_FIELDS, 0))
+
+    # Pengajuan/task yang sudah diarsipkan tetap dihitung pada harinya.
+    sources = (LIVE_TABLES[1:3], ARCHIVED_TABLES[1:3])
+    for chunk in _chunks(days):
+        for application_model, task_model in sources:
+            submitted = (
+                application_model.objects.filter(_day_range('submitted_at', chunk))
+                .annotate(day=TruncDate('submitted_at', tzinfo=tz)).filter(day__in=chunk)
+                .values('schedule__producer_id', 'day').annotate(n=Count('id'))
+            )
+            for a in submitted:
+                row(a['schedule__producer_id'], a['day'])['applicants'] += a['n']
+            responded = (
+                application_model.objects.filter(_day_range('responded_at', chunk), status__in=RESPONDED_STATUSES)
+                .annotate(day=TruncDate('responded_at', tzinfo=tz)).filter(day__in=chunk)
+                .values('schedule__producer_id', 'day', 'status')
+                .annotate(n=Count('id'), response=Sum(F('responded_at') - F('submitted_at')))
+            )
+            for a in responded:
+                r = row(a['schedule__producer_id'], a['day'])
+                r[a['status']] += a['n']
+                r['response_seconds'] += _seconds(a['response'])
+            completed = (
+                task_model.objects.filter(_day_range('completed_at', chunk), is_completed=True)
+                .annotate(day=TruncDate('completed_at', tzinfo=tz)).filter(day__in=chunk)
+                .values('schedule__producer_id', 'day')
+                .annotate(n=Count('id'), latency=Sum(F('completed_at') - F('created_at')))
+            )
+            for t in completed:
+                r = row(t['schedule__producer_id'], t['day'])
+                r['tasks_completed'] += t['n']
+                r['task_seconds'] += _seconds(t['latency'])
+    with transaction.atomic():
+        (DailyStats.objects.all() if replace_all else DailyStats.objects.filter(day__in=days)).delete()
+        DailyStats.objects.bulk_create(
+            DailyStats(producer_id=producer_id, day=day, **values)
+            for (producer_id, day), values in rows.items()
+        )
+    return len(days)
+
+
+def catch_up(full: bool = False) -> tuple[int, int]:
+    """Proses ulang baris yang berubah sejak watermark `stats`.
+
+    Mengembalikan jumlah (jadwal, hari) yang dihitung ulang.
+    """
+    now = timezone.now()
+    mark = None if full else Watermark.objects.filter(name='stats').first()
+    since = mark.value if mark else None
+
+    apps = ScheduleApplication.objects.all()
+    tasks = SocialMediaTask.objects.filter(is_completed=True, completed_at__isnull=False)
+    schedules = ShootingSchedule.objects.all()
+    trail = ApplicationTrail.objects.filter(recorded_at__lt=now)
+    if since is not None:
+        trail = trail.filter(recorded_at__gte=since)
+    if since is not None:
+        apps = apps.filter(updated_at__gte=since)
+        tasks = tasks.filter(updated_at__gte=since)
+        schedules = schedules.filter(created_at__gte=since)
+
+    schedule_ids: set[int] = set(schedules.values_list('id', flat=True))
+    days: set = set()
+    rows = apps.order_by().values_list('schedule_id', 'submitted_at', 'responded_at')
+    if since is not None:
+        rows = rows.union(trail.order_by().values_list('schedule_id', 'submitted_at', 'responded_at'), all=True)
+    for schedule_id, submitted_at, responded_at in rows.iterator():
+        schedule_ids.add(schedule_id)
+        days.add(timezone.localdate(submitted_at))
+        if responded_at:
+            days.add(timezone.localdate(responded_at))
+    for schedule_id, completed_at in tasks.values_list('schedule_id', 'completed_at').iterator():
+        schedule_ids.add(schedule_id)
+        days.add(timezone.localdate(completed_at))
+
+    archived_count = 0
+    if since is None:
+        # Mode penuh juga mencakup arsip (baris arsip tidak berubah, jadi mode inkremental melewatinya).
+        for submitted_at, responded_at in ArchivedApplication.objects.values_list('submitted_at', 'responded_at').iterator():
+            days.add(timezone.localdate(submitted_at))
+            if responded_at:
+                days.add(timezone.localdate(responded_at))
+        for completed_at in (
+            ArchivedSocialMediaTask.objects.filter(is_completed=True, completed_at__isnull=False)
+            .values_list('completed_at', flat=True).iterator()
+        ):
+            days.add(timezone.localdate(completed_at))
+        archived_count = rebuild_schedule_stats(ArchivedSchedule.objects.values_list('id', flat=True), archived=True)
+
+    rebuilt = rebuild_schedule_stats(schedule_ids) + archived_count, rebuild_daily_stats(days, replace_all=since is None)
+    Watermark.objects.update_or_create(name='stats', defaults={'value': now})
+    purge_trail()
+    return rebuilt
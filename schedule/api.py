@@ -0,0 +1,420 @@
+"""API JSON v1 untuk klien mobile.
+
+Memakai sesi login dan aturan izin yang sama dengan view HTML. Fitur utama:
+
+- sparse fieldset: `?fields=id,title,script` (naskah hanya dikirim jika diminta);
+- cursor pagination: `?limit=50&cursor=<next>`;
+- ETag/If-None-Match per halaman, dihitung dari kolom versi (mis. `updated_at`)
+  sebelum kolom berat dimuat, sehingga respons 304 tidak menyentuh naskah.
+"""
+from __future__ import annotations
+import base64
+import hashlib
+import json
+import zlib
+from datetime import date, datetime, time
+from functools import wraps
+from typing import Any, Callable
+
+from django.core.exceptions import ValidationError
+from django.db.models import Q, QuerySet
+from django.http import HttpRequest, HttpResponse
+from django.views.decorators.http import require_http_methods
+
+from . import actions
+from .forms import ShootingScheduleForm
+from .models import Notification, ScheduleApplication, ShootingSchedule, SocialMediaTask, User
+from .throttling import throttle
+
+try:  # Serializer cepat opsional.
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+DEFAULT_LIMIT = 50
+MAX_LIMIT = 200
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    raise TypeError(f'Tidak dapat di-serialize: {type(value).__name__}')
+
+
+def dumps(data: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data, default=_default)
+    return json.dumps(data, default=_default, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def json_response(data: Any, status: int = 200, **headers: str) -> HttpResponse:
+    response = HttpResponse(dumps(data), status=status, content_type='application/json')
+    for name, value in headers.items():
+        response[name.replace('_', '-')] = value
+    return response
+
+
+def error(message: str, status: int, **extra: Any) -> HttpResponse:
+    return json_response({'error': message, **extra}, status=status)
+
+
+def api_login_required(view: Callable) -> Callable:
+    @wraps(view)
+    def wrapper(request: HttpRequest, *args, **kwargs) -> HttpResponse:
+        if not request.user.is_authenticated:
+            return error('Login diperlukan.', 401)
+        return view(request, *args, **kwargs)
+    return wrapper
+
+
+def _payload(request: HttpRequest) -> dict | None:
+    """Body request sebagai dict; `None` jika JSON tidak valid atau format tidak didukung."""
+    if request.content_type == 'application/json':
+        try:
+            data = json.loads(request.body or b'{}')
+        except ValueError:
+            return None
+        return data if isinstance(data, dict) else None
+    if request.method == 'POST':
+        return request.POST.dict()
+    # Django hanya mem-parsing body form untuk POST.
+    return None
+
+
+def _invalid_payload(request: HttpRequest) -> HttpResponse:
+    if request.content_type != 'application/json' and request.method != 'POST':
+        return error('Gunakan Content-Type application/json.', 415)
+    return error('Body JSON harus berupa objek yang valid.', 400)
+
+
+class Resource:
+    """Deskripsi kolom, urutan, dan kolom versi (untuk ETag) sebuah resource."""
+
+    def __init__(self, columns: dict[str, str], default: tuple[str, ...], ordering: tuple[str, ...], version: tuple[str, ...]):
+        self.columns = columns
+        self.default = default
+        self.ordering = ordering
+        self.version = version
+
+    def fields(self, request: HttpRequest) -> tuple[str, ...] | None:
+        raw = request.GET.get('fields')
+        if not raw:
+            return self.default
+        names = tuple(dict.fromkeys(name.strip() for name in raw.split(',') if name.strip()))
+        if not names or any(name not in self.columns for name in names):
+            return None
+        return names
+
+    def rows(self, qs: QuerySet, fields: tuple[str, ...]) -> list[dict]:
+        columns = [self.columns[name] for name in fields]
+        result = []
+        for values in qs.values_list(*columns):
+            row = dict(zip(fields, values))
+            if 'script' in row:
+                row['script'] = zlib.decompress(bytes(row['script'])).decode('utf-8') if row['script'] else ''
+            result.append(row)
+        return result
+
+
+SCHEDULE = Resource(
+    columns={
+        'id': 'id', 'title': 'title', 'date': 'date', 'time': 'time', 'location': 'location',
+        'description': 'description', 'status': 'status', 'producer': 'producer_id',
+        'script': 'script_version__blob__data', 'updated_at': 'updated_at',
+    },
+    default=('id', 'title', 'date', 'time', 'location', 'status', 'producer', 'updated_at'),
+    ordering=('date', 'time', 'id'),
+    version=('id', 'status', 'updated_at'),
+)
+APPLICATION = Resource(
+    columns={
+        'id': 'id', 'schedule': 'schedule_id', 'actor': 'actor_id', 'status': 'status',
+        'submitted_at': 'submitted_at', 'responded_at': 'responded_at',
+    },
+    default=('id', 'schedule', 'actor', 'status', 'submitted_at', 'responded_at'),
+    ordering=('-id',),
+    version=('id', 'status', 'responded_at'),
+)
+TASK = Resource(
+    columns={
+        'id': 'id', 'schedule': 'schedule_id', 'editor': 'editor_id', 'social_media': 'social_media',
+        'caption': 'caption', 'film_title': 'film_title', 'due_date': 'due_date',
+        'is_completed': 'is_completed', 'completed_at': 'completed_at', 'updated_at': 'updated_at',
+    },
+    default=('id', 'schedule', 'editor', 'social_media', 'film_title', 'due_date', 'is_completed', 'updated_at'),
+    ordering=('due_date', 'id'),
+    version=('id', 'updated_at'),
+)
+NOTIFICATION = Resource(
+    columns={
+        'id': 'id', 'schedule': 'schedule_id', 'kind': 'kind', 'message': 'message', 'is_read': 'is_read',
+        'created_at': 'created_at',
+    },
+    default=('id', 'schedule', 'kind', 'message', 'is_read', 'created_at'),
+    ordering=('-id',),
+    version=('id', 'is_read', 'created_at'),
+)
+
+
+def _encode_cursor(values: list) -> str:
+    raw = json.dumps(values, default=_default, separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def _decode_cursor(cursor: str, size: int) -> list | None:
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)))
+    except ValueError:
+        return None
+    if not isinstance(values, list) or len(values) != size:
+        return None
+    # Hanya skalar JSON: null, objek, dan list tidak pernah dihasilkan oleh `_encode_cursor`.
+    if any(value is None or isinstance(value, (bool, dict, list)) for value in values):
+        return None
+    return values
+
+
+def _after(ordering: tuple[str, ...], values: list) -> Q:
+    """Filter keyset: baris yang berada setelah `values` menurut `ordering`."""
+    condition = Q()
+    for i, field in enumerate(ordering):
+        name = field.lstrip('-')
+        step = Q(**{f'{name}__lt' if field.startswith('-') else f'{name}__gt': values[i]})
+        for prev, value in zip(ordering[:i], values):
+            step &= Q(**{prev.lstrip('-'): value})
+        condition |= step
+    return condition
+
+
+def _etag(request: HttpRequest, *parts: Any) -> str:
+    digest = hashlib.sha1(repr((request.user.pk, request.get_full_path(), parts)).encode('utf-8')).hexdigest()
+    return f'W/"{digest}"'
+
+
+def _not_modified(request: HttpRequest, etag: str) -> bool:
+    header = request.headers.get('If-None-Match', '')
+    return etag in (tag.strip() for tag in header.split(',')) or header.strip() == '*'
+
+
+def list_response(request: HttpRequest, resource: Resource, qs: QuerySet) -> HttpResponse:
+    fields = resource.fields(request)
+    if fields is None:
+        return error('Parameter fields tidak valid.', 400, allowed=sorted(resource.columns))
+    try:
+        limit = min(max(int(request.GET.get('limit', DEFAULT_LIMIT)), 1), MAX_LIMIT)
+    except ValueError:
+        return error('Parameter limit tidak valid.', 400)
+    order_columns = [name.lstrip('-') for name in resource.ordering]
+    qs = qs.order_by(*resource.ordering)
+    cursor = request.GET.get('cursor')
+    if cursor:
+        values = _decode_cursor(cursor, len(order_columns))
+        if values is None:
+            return error('Cursor tidak valid.', 400)
+        try:
+            # Nilai dikonversi ke tipe kolom saat filter dibangun (mis. tanggal/jam yang salah format).
+            qs = qs.filter(_after(resource.ordering, values))
+        except (ValueError, TypeError, ValidationError):
+            return error('Cursor tidak valid.', 400)
+
+    # Kolom versi + kolom urutan saja: cukup untuk ETag dan cursor berikutnya.
+    probe = list(qs.values_list(*dict.fromkeys(resource.version + tuple(order_columns)))[:limit + 1])
+    page, has_more = probe[:limit], len(probe) > limit
+    etag = _etag(request, page, has_more)
+    if _not_modified(request, etag):
+        return HttpResponse(status=304, headers={'ETag': etag})
+
+    ids = [row[0] for row in page]
+    rows = resource.rows(qs.model.objects.filter(pk__in=ids).order_by(*resource.ordering), fields)
+    next_cursor = None
+    if has_more:
+        last = dict(zip(dict.fromkeys(resource.version + tuple(order_columns)), page[-1]))
+        next_cursor = _encode_cursor([last[name] for name in order_columns])
+    return json_response({'data': rows, 'next': next_cursor}, ETag=etag)
+
+
+def detail_response(request: HttpRequest, resource: Resource, qs: QuerySet, status: int = 200) -> HttpResponse:
+    fields = resource.fields(request)
+    if fields is None:
+        return error('Parameter fields tidak valid.', 400, allowed=sorted(resource.columns))
+    version = list(qs.values_list(*resource.version))
+    if not version:
+        return error('Tidak ditemukan.', 404)
+    etag = _etag(request, version)
+    if request.method == 'GET' and _not_modified(request, etag):
+        return HttpResponse(status=304, headers={'ETag': etag})
+    return json_response({'data': resource.rows(qs, fields)[0]}, status=status, ETag=etag)
+
+
+# --- Schedules -------------------------------------------------------------
+
+def _visible_schedules(user: User) -> QuerySet:
+    if user.role == 'producer':
+        return ShootingSchedule.objects.filter(producer=user)
+    if user.role == 'editor':
+        return ShootingSchedule.objects.filter(social_media_tasks__editor=user).distinct()
+    return ShootingSchedule.objects.filter(Q(status='available') | Q(applications__actor=user)).distinct()
+
+
+def _schedule_form(data: dict, instance: ShootingSchedule | None = None) -> ShootingScheduleForm:
+    if instance is not None:
+        # PATCH parsial: isi field yang tidak dikirim dengan nilai saat ini.
+        current = {
+            'title': instance.title, 'date': instance.date, 'time': instance.time,
+            'location': instance.location, 'description': instance.description, 'script': instance.script,
+        }
+        data = current | {k: v for k, v in data.items() if k in current}
+    return ShootingScheduleForm(data, instance=instance)
+
+
+@api_login_required
+@require_http_methods(['GET', 'POST'])
+def schedules(request: HttpRequest) -> HttpResponse:
+    user: User = request.user  # type: ignore
+    if request.method == 'POST':
+        if user.role != 'producer':
+            return error('Hanya produser yang dapat membuat jadwal.', 403)
+        data = _payload(request)
+        if data is None:
+            return _invalid_payload(request)
+        form = _schedule_form(data)
+        if not form.is_valid():
+            return error('Periksa kembali data Anda.', 400, fields=form.errors.get_json_data())
+        schedule: ShootingSchedule = form.save(commit=False)
+        schedule.producer = user
+        schedule.status = 'available'
+        schedule.save()
+        form.save_script(schedule)
+        return detail_response(request, SCHEDULE, ShootingSchedule.objects.filter(pk=schedule.pk), status=201)
+    qs = _visible_schedules(user)
+    status = request.GET.get('status')
+    if status:
+        qs = qs.filter(status=status)
+    return list_response(request, SCHEDULE, qs)
+
+
+@api_login_required
+@require_http_methods(['GET', 'PATCH'])
+def schedule_detail(request: HttpRequest, pk: int) -> HttpResponse:
+    user: User = request.user  # type: ignore
+    if request.method == 'PATCH':
+        schedule = ShootingSchedule.objects.select_related('script_version__blob').filter(pk=pk).first()
+        if schedule is None:
+            return error('Tidak ditemukan.', 404)
+        if user.role != 'producer' or schedule.producer_id != user.id:
+            return error('Tidak memiliki izin untuk mengedit jadwal ini.', 403)
+        data = _payload(request)
+        if data is None:
+            return _invalid_payload(request)
+        form = _schedule_form(data, schedule)
+        if not form.is_valid():
+            return error('Periksa kembali data Anda.', 400, fields=form.errors.get_json_data())
+        form.save()
+    return detail_response(request, SCHEDULE, _visible_schedules(user).filter(pk=pk))
+
+
+@api_login_required
+@require_http_methods(['POST'])
+@throttle('join')
+def join_schedule(request: HttpRequest, pk: int) -> HttpResponse:
+    user: User = request.user  # type: ignore
+    if user.role != 'actor':
+        return error('Hanya aktor yang dapat mengajukan jadwal.', 403)
+    schedule = ShootingSchedule.objects.select_related('producer').filter(pk=pk).first()
+    if schedule is None:
+        return error('Tidak ditemukan.', 404)
+    if ScheduleApplication.objects.filter(schedule=schedule, actor=user).exists():
+        return error('Anda sudah pernah mengajukan ke jadwal ini.', 409)
+    if schedule.status != 'available':
+        return error('Pendaftaran jadwal sudah ditutup atau selesai.', 409)
+    application = actions.apply_to_schedule(schedule, user)
+    return detail_response(request, APPLICATION, ScheduleApplication.objects.filter(pk=application.pk), status=201)
+
+
+# --- Applications ----------------------------------------------------------
+
+def _visible_applications(user: User) -> QuerySet:
+    if user.role == 'producer':
+        return ScheduleApplication.objects.filter(schedule__producer=user)
+    return ScheduleApplication.objects.filter(actor=user)
+
+
+@api_login_required
+@require_http_methods(['GET'])
+def applications(request: HttpRequest) -> HttpResponse:
+    qs = _visible_applications(request.user)  # type: ignore
+    status = request.GET.get('status')
+    if status:
+        qs = qs.filter(status=status)
+    schedule_id = request.GET.get('schedule')
+    if schedule_id and schedule_id.isdigit():
+        qs = qs.filter(schedule_id=schedule_id)
+    return list_response(request, APPLICATION, qs)
+
+
+@api_login_required
+@require_http_methods(['POST'])
+def respond_application(request: HttpRequest, app_id: int, status: str) -> HttpResponse:
+    user: User = request.user  # type: ignore
+    if user.role != 'producer':
+        return error('Hanya produser yang dapat mengelola pengajuan.', 403)
+    application = ScheduleApplication.objects.select_related('schedule', 'actor').filter(id=app_id).first()
+    if application is None:
+        return error('Tidak ditemukan.', 404)
+    if application.schedule.producer_id != user.id:
+        return error('Tidak memiliki izin untuk pengajuan ini.', 403)
+    actions.respond_to_application(application, status)
+    return detail_response(request, APPLICATION, ScheduleApplication.objects.filter(pk=application.pk))
+
+
+# --- Social media tasks ----------------------------------------------------
+
+def _visible_tasks(user: User) -> QuerySet:
+    if user.role == 'producer':
+        return SocialMediaTask.objects.filter(schedule__producer=user)
+    return SocialMediaTask.objects.filter(editor=user)
+
+
+@api_login_required
+@require_http_methods(['GET'])
+def tasks(request: HttpRequest) -> HttpResponse:
+    qs = _visible_tasks(request.user)  # type: ignore
+    completed = request.GET.get('completed')
+    if completed in ('0', '1'):
+        qs = qs.filter(is_completed=completed == '1')
+    return list_response(request, TASK, qs)
+
+
+@api_login_required
+@require_http_methods(['POST'])
+def complete_task(request: HttpRequest, task_id: int) -> HttpResponse:
+    user: User = request.user  # type: ignore
+    if user.role != 'editor':
+        return error('Hanya editor yang dapat menyelesaikan task.', 403)
+    task = SocialMediaTask.objects.select_related('schedule').filter(id=task_id, editor=user).first()
+    if task is None:
+        return error('Tidak ditemukan.', 404)
+    if not task.is_completed:
+        actions.complete_task(task)
+    return detail_response(request, TASK, SocialMediaTask.objects.filter(pk=task.pk))
+
+
+# --- Notifications ---------------------------------------------------------
+
+@api_login_required
+@require_http_methods(['GET'])
+def notifications(request: HttpRequest) -> HttpResponse:
+    qs = Notification.objects.filter(user=request.user)
+    if request.GET.get('unread') == '1':
+        qs = qs.filter(is_read=False)
+    return list_response(request, NOTIFICATION, qs)
+
+
+@api_login_required
+@require_http_methods(['POST'])
+def read_notification(request: HttpRequest, pk: int) -> HttpResponse:
+    qs = Notification.objects.filter(pk=pk, user=request.user)
+    if not qs.update(is_read=True):
+        return error('Tidak ditemukan.', 404)
+    return detail_response(request, NOTIFICATION, qs)
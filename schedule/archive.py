@@ -0,0 +1,65 @@
+"""Pemindahan jadwal `completed` lama beserta baris turunannya ke tabel arsip."""
+from __future__ import annotations
+from datetime import date
+
+from django.db import transaction
+
+from .models import (
+    ArchivedApplication, ArchivedNotification, ArchivedSchedule, ArchivedScheduleStats, ArchivedSocialMediaTask,
+    Notification, ScheduleApplication, ScheduleStats, ShootingSchedule, SocialMediaTask,
+)
+
+
+SCHEDULE_FIELDS = ('id', 'producer_id', 'title', 'date', 'time', 'location', 'description',
+                   'script_version__blob_id', 'status', 'created_at', 'updated_at')
+APPLICATION_FIELDS = ('schedule_id', 'actor_id', 'status', 'submitted_at', 'responded_at')
+TASK_FIELDS = ('schedule_id', 'editor_id', 'social_media', 'caption', 'film_title', 'due_date',
+               'is_completed', 'completed_at', 'created_at')
+NOTIFICATION_FIELDS = ('schedule_id', 'user_id', 'kind', 'message', 'is_read', 'created_at')
+STATS_FIELDS = ('schedule_id', 'producer_id', 'applicants', 'confirmed', 'rejected', 'response_seconds',
+                'tasks_completed', 'task_seconds')
+
+
+def archivable(before: date):
+    return ShootingSchedule.objects.filter(status='completed', date__lt=before)
+
+
+def _copy(model, rows: list[dict], archived: dict[int, int]) -> int:
+    model.objects.bulk_create(
+        model(**{**row, 'schedule_id': archived[row['schedule_id']]}) for row in rows
+    )
+    return len(rows)
+
+
+def archive_chunk(schedule_ids: list[int]) -> int:
+    """Arsipkan satu batch jadwal dalam satu transaksi; mengembalikan jumlah baris turunan."""
+    with transaction.atomic():
+        schedules = list(
+            ShootingSchedule.objects.select_for_update()
+            .filter(id__in=schedule_ids, status='completed').values(*SCHEDULE_FIELDS)
+        )
+        if not schedules:
+            return 0
+        ids = [row['id'] for row in schedules]
+        created = ArchivedSchedule.objects.bulk_create(
+            ArchivedSchedule(
+                original_id=row['id'], producer_id=row['producer_id'], title=row['title'], date=row['date'],
+                time=row['time'], location=row['location'], description=row['description'],
+                script_blob_id=row['script_version__blob_id'], status=row['status'],
+                created_at=row['created_at'], updated_at=row['updated_at'],
+            )
+            for row in schedules
+        )
+        archived = {obj.original_id: obj.pk for obj in created}
+        if None in archived.values():
+            # Backend tanpa RETURNING: ambil ulang pk arsip.
+            archived = dict(ArchivedSchedule.objects.filter(original_id__in=ids).values_list('original_id', 'id'))
+        moved = _copy(ArchivedApplication, list(ScheduleApplication.objects.filter(schedule_id__in=ids).order_by().values(*APPLICATION_FIELDS)), archived)
+        moved += _copy(ArchivedSocialMediaTask, list(SocialMediaTask.objects.filter(schedule_id__in=ids).order_by().values(*TASK_FIELDS)), archived)
+        moved += _copy(ArchivedNotification, list(Notification.objects.filter(schedule_id__in=ids).order_by().values(*NOTIFICATION_FIELDS)), archived)
+        # Statistik per jadwal disalin (bukan dihitung ulang) agar tetap tersedia setelah baris aktifnya terhapus.
+        _copy(ArchivedScheduleStats, list(ScheduleStats.objects.filter(schedule_id__in=ids).order_by().values(*STATS_FIELDS)), archived)
+        # Hapus dari tabel aktif; relasi lain (fitur, versi naskah) ikut terhapus.
+        # Isi naskah tetap ada di ScriptBlob yang dirujuk arsip.
+        ShootingSchedule.objects.filter(id__in=ids).delete()
+    return moved
@@ -1,7 +1,10 @@
 from __future__ import annotations
 from django import forms
 from django.contrib.auth.forms import UserCreationForm, AuthenticationForm
+from django.db import transaction
+from . import actions
 from .models import User, ShootingSchedule
+from .scripts import store_script
 
 
 COMMON_INPUT_CLASSES = 'w-full border rounded p-2'
@@ -56,19 +59,43 @@ class LoginForm(AuthenticationForm):
 class ShootingScheduleForm(forms.ModelForm):
     date = forms.DateField(widget=forms.DateInput(attrs={'type': 'date'}), label='Tanggal')
     time = forms.TimeField(widget=forms.TimeInput(attrs={'type': 'time'}), label='Waktu')
+    # Naskah disimpan terpisah di ScriptBlob/ScriptVersion, bukan kolom jadwal.
+    script = forms.CharField(widget=forms.Textarea, required=False, strip=False, label='Script/Naskah')
 
     class Meta:
         model = ShootingSchedule
-        fields = ['title', 'date', 'time', 'location', 'description', 'script']
+        fields = ['title', 'date', 'time', 'location', 'description']
         labels = {
             'title': 'Judul/Scene',
             'location': 'Lokasi',
             'description': 'Deskripsi',
-            'script': 'Script/Naskah',
         }
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        if self.instance.pk:
+            self.fields['script'].initial = self.instance.script
         for name, field in self.fields.items():
             css = field.widget.attrs.get('class', '')
             field.widget.attrs['class'] = f"{css} {COMMON_INPUT_CLASSES}".strip()
+
+    def save(self, commit: bool = True) -> ShootingSchedule:
+        schedule: ShootingSchedule = super().save(commit=False)
+        if commit:
+            with transaction.atomic():
+                if schedule._state.adding:
+                    schedule.save()
+                else:
+                    # Hanya kolom yang berubah yang ditulis ulang.
+                    fields = [name for name in self.changed_data if name != 'script']
+                    if fields:
+                        schedule.save(update_fields=fields + ['updated_at'])
+                    if any(name in actions.NOTIFY_FIELDS for name in fields):
+                        transaction.on_commit(lambda: actions.notify_schedule_change(schedule.pk))
+                self.save_script(schedule)
+        return schedule
+
+    def save_script(self, schedule: ShootingSchedule) -> None:
+        """Untuk `save(commit=False)`: panggil setelah jadwal disimpan."""
+        if 'script' in self.changed_data:
+            store_script(schedule, self.cleaned_data['script'])
@@ -0,0 +1,30 @@
+from __future__ import annotations
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from schedule import archive
+
+
+class Command(BaseCommand):
+    help = 'Move completed schedules older than a cutoff, with their dependent rows, into the archive tables.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=90, help='Archive completed schedules dated more than N days ago.')
+        parser.add_argument('--chunk-size', type=int, default=200, help='Schedules moved per transaction.')
+        parser.add_argument('--dry-run', action='store_true')
+
+    def handle(self, *args, **options):
+        before = timezone.localdate() - timezone.timedelta(days=options['days'])
+        candidates = archive.archivable(before).order_by('id').values_list('id', flat=True)
+        if options['dry_run']:
+            self.stdout.write(f'Would archive {candidates.count()} schedules dated before {before}')
+            return
+        schedules = rows = 0
+        last_id = 0
+        while True:
+            chunk = list(candidates.filter(id__gt=last_id)[:options['chunk_size']])
+            if not chunk:
+                break
+            rows += archive.archive_chunk(chunk)
+            schedules += len(chunk)
+            last_id = chunk[-1]
+        self.stdout.write(self.style.SUCCESS(f'Archived {schedules} schedules ({rows} dependent rows) dated before {before}'))
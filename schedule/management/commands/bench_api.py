@@ -0,0 +1,52 @@
+from __future__ import annotations
+import time
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.test import Client
+from django.urls import reverse
+from schedule.models import User
+
+
+PAGES = {
+    'producer': (('HTML dashboard', 'producer_dashboard', ''), ('API schedules', 'api_schedules', ''),
+                 ('API schedules +script', 'api_schedules', '?fields=id,title,date,time,location,status,script')),
+    'actor': (('HTML my schedules', 'actor_my_schedules', ''), ('HTML available', 'actor_available_schedules', ''),
+              ('API schedules', 'api_schedules', ''), ('API applications', 'api_applications', '')),
+    'editor': (('HTML dashboard', 'editor_dashboard', ''), ('API tasks', 'api_tasks', '')),
+}
+
+
+class Command(BaseCommand):
+    help = 'Compare payload size and latency of the HTML dashboards with the JSON API for one user.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('username')
+        parser.add_argument('--runs', type=int, default=20)
+
+    def handle(self, *args, **options):
+        try:
+            user = User.objects.get(username=options['username'])
+        except User.DoesNotExist:
+            raise CommandError(f"User '{options['username']}' tidak ditemukan.")
+        if user.role not in PAGES:
+            raise CommandError(f'Peran tidak dikenal: {user.role}')
+        host = next((h.lstrip('.') for h in settings.ALLOWED_HOSTS if h != '*'), 'localhost')
+        client = Client(SERVER_NAME=host)
+        client.force_login(user)
+        runs = max(options['runs'], 1)
+        self.stdout.write(f"{'page':<26}{'bytes':>10}{'mean ms':>10}{'304 ms':>10}")
+        for label, name, query in PAGES[user.role]:
+            url = reverse(name) + query
+            size, elapsed, etag = 0, 0.0, None
+            for _ in range(runs):
+                start = time.perf_counter()
+                response = client.get(url)
+                elapsed += time.perf_counter() - start
+                size, etag = len(response.content), response.get('ETag')
+            conditional = '-'
+            if etag:
+                start = time.perf_counter()
+                for _ in range(runs):
+                    client.get(url, HTTP_IF_NONE_MATCH=etag)
+                conditional = f'{(time.perf_counter() - start) / runs * 1000:.2f}'
+            self.stdout.write(f'{label:<26}{size:>10}{elapsed / runs * 1000:>10.2f}{conditional:>10}')
@@ -0,0 +1,14 @@
+from __future__ import annotations
+from django.core.management.base import BaseCommand
+from schedule import recommendations
+
+
+class Command(BaseCommand):
+    help = 'Refresh schedule and actor feature vectors changed since the last run.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--full', action='store_true', help='Ignore the watermark and recompute every vector.')
+
+    def handle(self, *args, **options):
+        schedules, actors = recommendations.refresh(full=options['full'])
+        self.stdout.write(self.style.SUCCESS(f'Features refreshed: {schedules} schedules, {actors} actors'))
@@ -0,0 +1,14 @@
+from __future__ import annotations
+from django.core.management.base import BaseCommand
+from schedule import analytics
+
+
+class Command(BaseCommand):
+    help = 'Catch up casting summary tables for rows changed since the last run.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--full', action='store_true', help='Ignore the watermark and rebuild every summary row.')
+
+    def handle(self, *args, **options):
+        schedules, days = analytics.catch_up(full=options['full'])
+        self.stdout.write(self.style.SUCCESS(f'Stats rebuilt: {schedules} schedules, {days} days'))
@@ -0,0 +1,58 @@
+from __future__ import annotations
+import logging
+import time
+from datetime import timedelta
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+from django.utils import timezone
+from schedule.reminders import ReminderScheduler, dispatch
+
+logger = logging.getLogger(__name__)
+# Jeda sebelum mencoba lagi setelah tick gagal (mis. SQLite "database is locked").
+RETRY_DELAY = 5
+
+
+class Command(BaseCommand):
+    help = 'Long-running reminder scheduler (H-1, H-3h and task due-date reminders).'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--poll', type=float, default=30, help='Seconds between polls for changed schedules/tasks.')
+        parser.add_argument('--grace', type=int, default=30, help='Minutes a missed reminder is still sent after its time.')
+        parser.add_argument('--once', action='store_true', help='Load, send everything currently due, then exit.')
+
+    def handle(self, *args, **options):
+        scheduler = ReminderScheduler(grace=timedelta(minutes=options['grace']))
+        poll = timedelta(seconds=options['poll'])
+        loaded = scheduler.poll()
+        self.stdout.write(f'Loaded {loaded} schedules/tasks, {len(scheduler)} pending reminders')
+        next_poll = timezone.now() + poll
+        try:
+            while True:
+                due = scheduler.pop_due()
+                try:
+                    sent = dispatch(due)
+                except Exception:
+                    # Satu tick yang gagal tidak boleh menghentikan daemon: reminder dikembalikan ke heap.
+                    logger.exception('Gagal mengirim %d reminder; dicoba lagi dalam %ss', len(due), RETRY_DELAY)
+                    scheduler.requeue(due)
+                    close_old_connections()
+                    if options['once']:
+                        raise
+                    time.sleep(RETRY_DELAY)
+                    continue
+                if sent:
+                    self.stdout.write(self.style.SUCCESS(f'{timezone.localtime():%Y-%m-%d %H:%M:%S} reminders created: {sent}'))
+                if options['once']:
+                    return
+                now = timezone.now()
+                if now >= next_poll:
+                    try:
+                        scheduler.poll(now)
+                    except Exception:
+                        logger.exception('Gagal memuat perubahan jadwal/task; dicoba lagi pada poll berikutnya')
+                    next_poll = now + poll
+                    close_old_connections()
+                wake = min(filter(None, (scheduler.next_fire_at(), next_poll)))
+                time.sleep(max((wake - timezone.now()).total_seconds(), 0.05))
+        except KeyboardInterrupt:
+            self.stdout.write('Scheduler stopped.')
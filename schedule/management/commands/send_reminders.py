@@ -1,7 +1,8 @@
 from __future__ import annotations
 from django.core.management.base import BaseCommand
 from django.utils import timezone
-from schedule.models import ShootingSchedule, ScheduleApplication, Notification
+from schedule.models import ShootingSchedule
+from schedule.reminders import Reminder, dispatch, schedule_start
 
 
 class Command(BaseCommand):
@@ -9,17 +10,12 @@ class Command(BaseCommand):
 
     def handle(self, *args, **options):
         tomorrow = timezone.localdate() + timezone.timedelta(days=1)
-        # Ambil aplikasi yang terkonfirmasi untuk jadwal besok (jadwal belum completed)
-        apps = ScheduleApplication.objects.select_related('schedule', 'actor').filter(
-            status='confirmed',
-            schedule__date=tomorrow,
-        )
-        count = 0
-        for app in apps:
-            s = app.schedule
-            if s.status == 'completed':
-                continue
-            msg = f"Reminder: Besok ada syuting '{s.title}' jam {s.time} di {s.location}"
-            Notification.objects.create(user=app.actor, schedule=s, message=msg)
-            count += 1
+        # Jadwal besok (belum completed); aktor terkonfirmasi dicari oleh dispatch.
+        # Reminder yang sudah dikirim `run_scheduler` tidak dikirim ulang.
+        schedules = ShootingSchedule.objects.filter(date=tomorrow).exclude(status='completed').only('id', 'date', 'time')
+        reminders = []
+        for s in schedules:
+            start = schedule_start(s)
+            reminders.append(Reminder(timezone.now(), 'schedule', s.pk, 'h-1', start))
+        count = dispatch(reminders)
         self.stdout.write(self.style.SUCCESS(f'Reminders created: {count}'))
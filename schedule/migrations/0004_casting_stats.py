@@ -0,0 +1,94 @@
+# Generated by Django 5.2.18 on 2026-10-19 14:01
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('schedule', '0003_alter_user_role_socialmediatask'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailyStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('applicants', models.PositiveIntegerField(default=0)),
+                ('confirmed', models.PositiveIntegerField(default=0)),
+                ('rejected', models.PositiveIntegerField(default=0)),
+                ('response_seconds', models.BigIntegerField(default=0)),
+                ('tasks_completed', models.PositiveIntegerField(default=0)),
+                ('task_seconds', models.BigIntegerField(default=0)),
+                ('day', models.DateField()),
+            ],
+            options={
+                'verbose_name': 'Daily Stats',
+                'verbose_name_plural': 'Daily Stats',
+                'ordering': ['-day'],
+            },
+        ),
+        migrations.CreateModel(
+            name='ScheduleStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('applicants', models.PositiveIntegerField(default=0)),
+                ('confirmed', models.PositiveIntegerField(default=0)),
+                ('rejected', models.PositiveIntegerField(default=0)),
+                ('response_seconds', models.BigIntegerField(default=0)),
+                ('tasks_completed', models.PositiveIntegerField(default=0)),
+                ('task_seconds', models.BigIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Schedule Stats',
+                'verbose_name_plural': 'Schedule Stats',
+                'ordering': ['-updated_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='Watermark',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=50, unique=True)),
+                ('value', models.DateTimeField()),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='scheduleapplication',
+            index=models.Index(fields=['submitted_at'], name='schedule_sc_submitt_453c10_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='scheduleapplication',
+            index=models.Index(fields=['responded_at'], name='schedule_sc_respond_90ae0b_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='socialmediatask',
+            index=models.Index(fields=['completed_at'], name='schedule_so_complet_eeaca1_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='socialmediatask',
+            index=models.Index(fields=['updated_at'], name='schedule_so_updated_9db461_idx'),
+        ),
+        migrations.AddField(
+            model_name='dailystats',
+            name='producer',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_stats', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name='schedulestats',
+            name='producer',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='schedule_stats', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name='schedulestats',
+            name='schedule',
+            field=models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='stats', to='schedule.shootingschedule'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='dailystats',
+            unique_together={('producer', 'day')},
+        ),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 5.2.18 on 2026-10-19 14:02
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('schedule', '0004_casting_stats'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ScriptBlob',
+            fields=[
+                ('digest', models.CharField(max_length=64, primary_key=True, serialize=False)),
+                ('data', models.BinaryField()),
+                ('size', models.PositiveIntegerField(default=0)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='ScriptVersion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('number', models.PositiveIntegerField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('blob', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='versions', to='schedule.scriptblob')),
+                ('schedule', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='script_versions', to='schedule.shootingschedule')),
+            ],
+            options={
+                'ordering': ['-number'],
+                'unique_together': {('schedule', 'number')},
+            },
+        ),
+        migrations.AddField(
+            model_name='shootingschedule',
+            name='script_version',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='schedule.scriptversion'),
+        ),
+    ]
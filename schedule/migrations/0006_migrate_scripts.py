@@ -0,0 +1,44 @@
+# Generated by Django 5.2.18 on 2026-10-19 14:02
+
+import hashlib
+import zlib
+
+from django.db import migrations
+
+
+def forwards(apps, schema_editor):
+    ShootingSchedule = apps.get_model('schedule', 'ShootingSchedule')
+    ScriptBlob = apps.get_model('schedule', 'ScriptBlob')
+    ScriptVersion = apps.get_model('schedule', 'ScriptVersion')
+    rows = ShootingSchedule.objects.exclude(script='').values_list('id', 'script')
+    for schedule_id, text in rows.iterator(chunk_size=500):
+        raw = text.encode('utf-8')
+        blob, _ = ScriptBlob.objects.get_or_create(
+            digest=hashlib.sha256(raw).hexdigest(),
+            defaults={'data': zlib.compress(raw, 6), 'size': len(raw)},
+        )
+        version = ScriptVersion.objects.create(schedule_id=schedule_id, blob=blob, number=1)
+        ShootingSchedule.objects.filter(id=schedule_id).update(script_version=version)
+
+
+def backwards(apps, schema_editor):
+    ShootingSchedule = apps.get_model('schedule', 'ShootingSchedule')
+    ScriptBlob = apps.get_model('schedule', 'ScriptBlob')
+    ScriptVersion = apps.get_model('schedule', 'ScriptVersion')
+    rows = ShootingSchedule.objects.filter(script_version__isnull=False).values_list('id', 'script_version__blob__data')
+    for schedule_id, data in rows.iterator(chunk_size=500):
+        ShootingSchedule.objects.filter(id=schedule_id).update(script=zlib.decompress(bytes(data)).decode('utf-8'))
+    ShootingSchedule.objects.update(script_version=None)
+    ScriptVersion.objects.all().delete()
+    ScriptBlob.objects.all().delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('schedule', '0005_script_store'),
+    ]
+
+    operations = [
+        migrations.RunPython(forwards, backwards),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-19 14:02
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('schedule', '0006_migrate_scripts'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='shootingschedule',
+            name='script',
+        ),
+    ]
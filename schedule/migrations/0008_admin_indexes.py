@@ -0,0 +1,30 @@
+# Generated by Django 5.2.18 on 2026-10-19 14:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('schedule', '0007_remove_shootingschedule_script'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(fields=['created_at'], name='schedule_no_created_1dcaba_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='shootingschedule',
+            index=models.Index(fields=['date', 'time'], name='schedule_sh_date_a24e86_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='socialmediatask',
+            index=models.Index(fields=['due_date'], name='schedule_so_due_dat_9d02e8_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(fields=['date_joined'], name='schedule_us_date_jo_beb993_idx'),
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.2.18 on 2026-10-19 14:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('schedule', '0008_admin_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReminderLog',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('schedule', 'Jadwal'), ('task', 'Task')], max_length=16)),
+                ('object_id', models.PositiveBigIntegerField()),
+                ('window', models.CharField(max_length=16)),
+                ('target', models.DateTimeField()),
+                ('sent_at', models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='shootingschedule',
+            index=models.Index(fields=['updated_at'], name='schedule_sh_updated_2e5c66_idx'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='reminderlog',
+            unique_together={('kind', 'object_id', 'window', 'target')},
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 5.2.18 on 2026-10-19 14:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('schedule', '0009_reminder_log'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='notification',
+            name='kind',
+            field=models.CharField(choices=[('general', 'Umum'), ('schedule_change', 'Perubahan Jadwal')], default='general', max_length=20),
+        ),
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(fields=['schedule', 'kind', 'is_read'], name='schedule_no_schedul_4a87f4_idx'),
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.2.18 on 2026-10-19 14:07
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('schedule', '0010_notification_kind'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ActorFeatures',
+            fields=[
+                ('actor', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='features', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('vector', models.BinaryField()),
+                ('applications', models.PositiveIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='ScheduleFeatures',
+            fields=[
+                ('schedule', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='features', serialize=False, to='schedule.shootingschedule')),
+                ('vector', models.BinaryField()),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+    ]
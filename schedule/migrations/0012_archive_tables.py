@@ -0,0 +1,78 @@
+# Generated by Django 5.2.18 on 2026-10-19 14:08
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('schedule', '0011_recommendation_features'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedSchedule',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('original_id', models.PositiveBigIntegerField(unique=True)),
+                ('title', models.CharField(max_length=200)),
+                ('date', models.DateField()),
+                ('time', models.TimeField()),
+                ('location', models.CharField(max_length=200)),
+                ('description', models.TextField(blank=True)),
+                ('status', models.CharField(choices=[('available', 'Tersedia'), ('closed', 'Ditutup'), ('completed', 'Selesai')], default='completed', max_length=20)),
+                ('created_at', models.DateTimeField()),
+                ('updated_at', models.DateTimeField()),
+                ('archived_at', models.DateTimeField(auto_now_add=True)),
+                ('producer', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='archived_schedules', to=settings.AUTH_USER_MODEL)),
+                ('script_blob', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='schedule.scriptblob')),
+            ],
+            options={
+                'ordering': ['-date', '-time'],
+            },
+        ),
+        migrations.CreateModel(
+            name='ArchivedNotification',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('general', 'Umum'), ('schedule_change', 'Perubahan Jadwal')], default='general', max_length=20)),
+                ('message', models.TextField()),
+                ('is_read', models.BooleanField(default=False)),
+                ('created_at', models.DateTimeField()),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='archived_notifications', to=settings.AUTH_USER_MODEL)),
+                ('schedule', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='notifications', to='schedule.archivedschedule')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='ArchivedApplication',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(choices=[('pending', 'Menunggu Konfirmasi'), ('confirmed', 'Terkonfirmasi'), ('rejected', 'Ditolak')], max_length=16)),
+                ('submitted_at', models.DateTimeField()),
+                ('responded_at', models.DateTimeField(blank=True, null=True)),
+                ('actor', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='archived_applications', to=settings.AUTH_USER_MODEL)),
+                ('schedule', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='applications', to='schedule.archivedschedule')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='ArchivedSocialMediaTask',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('social_media', models.CharField(choices=[('instagram', 'Instagram'), ('tiktok', 'TikTok'), ('youtube', 'YouTube')], max_length=20)),
+                ('caption', models.TextField()),
+                ('film_title', models.CharField(max_length=200)),
+                ('due_date', models.DateTimeField()),
+                ('is_completed', models.BooleanField(default=False)),
+                ('completed_at', models.DateTimeField(blank=True, null=True)),
+                ('created_at', models.DateTimeField()),
+                ('editor', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='archived_tasks', to=settings.AUTH_USER_MODEL)),
+                ('schedule', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='social_media_tasks', to='schedule.archivedschedule')),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='archivedschedule',
+            index=models.Index(fields=['producer', 'date'], name='schedule_ar_produce_9714c9_idx'),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.18 on 2026-10-19 14:15
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('schedule', '0012_archive_tables'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedScheduleStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('applicants', models.PositiveIntegerField(default=0)),
+                ('confirmed', models.PositiveIntegerField(default=0)),
+                ('rejected', models.PositiveIntegerField(default=0)),
+                ('response_seconds', models.BigIntegerField(default=0)),
+                ('tasks_completed', models.PositiveIntegerField(default=0)),
+                ('task_seconds', models.BigIntegerField(default=0)),
+                ('producer', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='archived_schedule_stats', to=settings.AUTH_USER_MODEL)),
+                ('schedule', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='stats', to='schedule.archivedschedule')),
+            ],
+            options={
+                'verbose_name': 'Archived Schedule Stats',
+                'verbose_name_plural': 'Archived Schedule Stats',
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-19 14:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('schedule', '0013_archived_schedule_stats'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='reminderlog',
+            name='claim',
+            field=models.UUIDField(blank=True, editable=False, null=True),
+        ),
+    ]
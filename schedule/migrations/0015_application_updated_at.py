@@ -0,0 +1,32 @@
+# Generated by Django 5.2.18 on 2026-10-19 14:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('schedule', '0014_reminder_log_claim'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DeletedApplication',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('schedule_id', models.PositiveBigIntegerField()),
+                ('submitted_at', models.DateTimeField()),
+                ('responded_at', models.DateTimeField(blank=True, null=True)),
+                ('deleted_at', models.DateTimeField(auto_now_add=True, db_index=True)),
+            ],
+        ),
+        migrations.AddField(
+            model_name='scheduleapplication',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddIndex(
+            model_name='scheduleapplication',
+            index=models.Index(fields=['updated_at'], name='schedule_sc_updated_3119b6_idx'),
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 5.2.18 on 2026-10-19 14:25
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('schedule', '0015_application_updated_at'),
+    ]
+
+    operations = [
+        migrations.RenameModel(
+            old_name='DeletedApplication',
+            new_name='ApplicationTrail',
+        ),
+        migrations.RenameField(
+            model_name='applicationtrail',
+            old_name='deleted_at',
+            new_name='recorded_at',
+        ),
+    ]
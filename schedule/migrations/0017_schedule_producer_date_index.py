@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-19 14:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('schedule', '0016_application_trail'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='shootingschedule',
+            index=models.Index(fields=['producer', 'date', 'time'], name='schedule_sh_produce_cff0c9_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-19 14:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('schedule', '0017_schedule_producer_date_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='applicationtrail',
+            name='actor_id',
+            field=models.PositiveBigIntegerField(blank=True, null=True),
+        ),
+    ]
@@ -1,4 +1,5 @@
 from __future__ import annotations
+import zlib
 from django.contrib.auth.models import AbstractUser
 from django.db import models
 from django.utils import timezone
@@ -14,6 +15,9 @@ class User(AbstractUser):
     role = models.CharField(max_length=20, choices=ROLE_CHOICES, default='actor')
     phone = models.CharField(max_length=30, blank=True)
 
+    class Meta(AbstractUser.Meta):
+        indexes = [models.Index(fields=['date_joined'])]
+
     def __str__(self) -> str:
         return self.get_full_name() or self.username
 
@@ -31,17 +35,28 @@ class ShootingSchedule(models.Model):
     time = models.TimeField()
     location = models.CharField(max_length=200)
     description = models.TextField(blank=True)
-    script = models.TextField(blank=True)
+    script_version = models.ForeignKey('ScriptVersion', on_delete=models.SET_NULL, null=True, blank=True, related_name='+')
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='available')
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ['date', 'time']
+        indexes = [
+            models.Index(fields=['date', 'time']),
+            models.Index(fields=['updated_at']),
+            # Jadwal terbaru per produser langsung dari indeks (halaman analitik, dashboard).
+            models.Index(fields=['producer', 'date', 'time']),
+        ]
 
     def __str__(self) -> str:
         return f"{self.title} - {self.date} {self.time}"
 
+    @property
+    def script(self) -> str:
+        # Isi naskah ada di ScriptBlob; gunakan select_related('script_version__blob') pada daftar.
+        return self.script_version.blob.text if self.script_version_id else ''
+
     def is_tomorrow(self) -> bool:
         today = timezone.localdate()
         return self.date == today + timezone.timedelta(days=1)
@@ -53,6 +68,38 @@ class ShootingSchedule(models.Model):
         return ", ".join(actor.get_full_name() or actor.username for actor in self.get_confirmed_actors())
 
 
+class ScriptBlob(models.Model):
+    """Isi naskah terkompresi (zlib), dialamatkan oleh SHA-256 teksnya sehingga naskah sama hanya disimpan sekali."""
+    digest = models.CharField(max_length=64, primary_key=True)
+    data = models.BinaryField()
+    size = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self) -> str:
+        return self.digest[:12]
+
+    @property
+    def text(self) -> str:
+        cached = getattr(self, '_text', None)
+        if cached is None:
+            cached = self._text = zlib.decompress(bytes(self.data)).decode('utf-8')
+        return cached
+
+
+class ScriptVersion(models.Model):
+    schedule = models.ForeignKey(ShootingSchedule, on_delete=models.CASCADE, related_name='script_versions')
+    blob = models.ForeignKey(ScriptBlob, on_delete=models.PROTECT, related_name='versions')
+    number = models.PositiveIntegerField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        unique_together = (('schedule', 'number'),)
+        ordering = ['-number']
+
+    def __str__(self) -> str:
+        return f"{self.schedule_id} v{self.number}"
+
+
 class ScheduleApplication(models.Model):
     STATUS_CHOICES = [
         ('pending', 'Menunggu Konfirmasi'),
@@ -64,13 +111,26 @@ class ScheduleApplication(models.Model):
     status = models.CharField(max_length=16, choices=STATUS_CHOICES, default='pending')
     submitted_at = models.DateTimeField(auto_now_add=True)
     responded_at = models.DateTimeField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         unique_together = (('schedule', 'actor'),)
         ordering = ['-submitted_at']
+        indexes = [
+            models.Index(fields=['submitted_at']),
+            models.Index(fields=['responded_at']),
+            models.Index(fields=['updated_at']),
+        ]
     def __str__(self):
         return f"{self.actor} pada {self.schedule} ({self.status})"
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Respons saat dimuat; dibandingkan saat save untuk jejak statistik (lihat `schedule.analytics`).
+        instance._loaded_response = (instance.__dict__.get('status'), instance.__dict__.get('responded_at'))
+        return instance
+
 
 class SocialMediaTask(models.Model):
     SOCIAL_CHOICES = [
@@ -93,6 +153,11 @@ class SocialMediaTask(models.Model):
     class Meta:
         ordering = ['due_date']
         verbose_name = 'Social Media Task'
+        indexes = [
+            models.Index(fields=['due_date']),
+            models.Index(fields=['completed_at']),
+            models.Index(fields=['updated_at']),
+        ]
 
     def __str__(self) -> str:
         return f"{self.film_title} - {self.get_social_media_display()}"
@@ -102,11 +167,225 @@ class SocialMediaTask(models.Model):
 
 
 class Notification(models.Model):
+    KIND_CHOICES = [
+        ('general', 'Umum'),
+        ('schedule_change', 'Perubahan Jadwal'),
+    ]
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='notifications')
     schedule = models.ForeignKey(ShootingSchedule, on_delete=models.CASCADE, related_name='notifications')
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES, default='general')
     message = models.TextField()
     is_read = models.BooleanField(default=False)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['created_at']),
+            models.Index(fields=['schedule', 'kind', 'is_read']),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.user} - {self.message[:40]}"
+
+
+class ReminderLog(models.Model):
+    """Penanda reminder yang sudah dikirim, agar pengiriman idempoten (lihat `schedule.reminders`)."""
+    KIND_CHOICES = [
+        ('schedule', 'Jadwal'),
+        ('task', 'Task'),
+    ]
+    kind = models.CharField(max_length=16, choices=KIND_CHOICES)
+    object_id = models.PositiveBigIntegerField()
+    window = models.CharField(max_length=16)
+    target = models.DateTimeField()
+    sent_at = models.DateTimeField(auto_now_add=True)
+    # Token proses `dispatch` yang berhasil menyisipkan baris ini (klaim pengiriman).
+    claim = models.UUIDField(null=True, blank=True, editable=False)
+
+    class Meta:
+        unique_together = (('kind', 'object_id', 'window', 'target'),)
+
+    def __str__(self) -> str:
+        return f"{self.kind}:{self.object_id} {self.window}"
+
+
+class StatsCounters(models.Model):
+    applicants = models.PositiveIntegerField(default=0)
+    confirmed = models.PositiveIntegerField(default=0)
+    rejected = models.PositiveIntegerField(default=0)
+    response_seconds = models.BigIntegerField(default=0)
+    tasks_completed = models.PositiveIntegerField(default=0)
+    task_seconds = models.BigIntegerField(default=0)
+
+    class Meta:
+        abstract = True
+
+    @property
+    def responded(self) -> int:
+        return self.confirmed + self.rejected
+
+    @property
+    def approval_rate(self) -> float | None:
+        return self.confirmed / self.responded * 100 if self.responded else None
+
+    @property
+    def avg_response_hours(self) -> float | None:
+        return self.response_seconds / self.responded / 3600 if self.responded else None
+
+    @property
+    def avg_task_hours(self) -> float | None:
+        return self.task_seconds / self.tasks_completed / 3600 if self.tasks_completed else None
+
+
+class ScheduleStats(StatsCounters):
+    """Ringkasan casting per jadwal, diperbarui inkremental (lihat `schedule.analytics`)."""
+    schedule = models.OneToOneField(ShootingSchedule, on_delete=models.CASCADE, related_name='stats')
+    producer = models.ForeignKey(User, on_delete=models.CASCADE, related_name='schedule_stats')
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['-updated_at']
+        verbose_name = 'Schedule Stats'
+        verbose_name_plural = 'Schedule Stats'
+
+    def __str__(self) -> str:
+        return f"Stats {self.schedule_id}"
+
+
+class DailyStats(StatsCounters):
+    """Ringkasan casting harian per produser (tanggal lokal saat event terjadi)."""
+    producer = models.ForeignKey(User, on_delete=models.CASCADE, related_name='daily_stats')
+    day = models.DateField()
+
+    class Meta:
+        unique_together = (('producer', 'day'),)
+        ordering = ['-day']
+        verbose_name = 'Daily Stats'
+        verbose_name_plural = 'Daily Stats'
+
+    def __str__(self) -> str:
+        return f"{self.producer} - {self.day}"
+
+class ScheduleFeatures(models.Model):
+    """Vektor fitur jadwal (float32) untuk rekomendasi; lihat `schedule.recommendations`."""
+    schedule = models.OneToOneField(ShootingSchedule, on_delete=models.CASCADE, primary_key=True, related_name='features')
+    vector = models.BinaryField()
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self) -> str:
+        return f"Features {self.schedule_id}"
+
+
+class ActorFeatures(models.Model):
+    """Vektor preferensi aktor dari riwayat pengajuannya."""
+    actor = models.OneToOneField(User, on_delete=models.CASCADE, primary_key=True, related_name='features')
+    vector = models.BinaryField()
+    applications = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self) -> str:
+        return f"Features {self.actor_id}"
+
+
+class ApplicationTrail(models.Model):
+    """Nilai lama pengajuan yang dihapus atau responnya diubah.
+
+    `refresh_stats` inkremental memakai baris ini untuk menghitung ulang hari
+    respons lama, yang tidak lagi terlihat dari baris pengajuan saat ini;
+    `refresh_recommendations` memakai `actor_id` untuk aktor yang pengajuannya dihapus.
+    """
+    schedule_id = models.PositiveBigIntegerField()
+    actor_id = models.PositiveBigIntegerField(null=True, blank=True)
+    submitted_at = models.DateTimeField()
+    responded_at = models.DateTimeField(null=True, blank=True)
+    recorded_at = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    def __str__(self) -> str:
+        return f"Jejak pengajuan pada jadwal {self.schedule_id}"
+
+
+class Watermark(models.Model):
+    """Posisi terakhir yang sudah diproses oleh management command inkremental."""
+    name = models.CharField(max_length=50, unique=True)
+    value = models.DateTimeField()
+
+    def __str__(self) -> str:
+        return f"{self.name} @ {self.value}"
+
+
+class ArchivedSchedule(models.Model):
+    """Jadwal `completed` yang dipindahkan dari tabel aktif oleh `archive_schedules`."""
+    original_id = models.PositiveBigIntegerField(unique=True)
+    producer = models.ForeignKey(User, on_delete=models.CASCADE, related_name='archived_schedules')
+    title = models.CharField(max_length=200)
+    date = models.DateField()
+    time = models.TimeField()
+    location = models.CharField(max_length=200)
+    description = models.TextField(blank=True)
+    script_blob = models.ForeignKey(ScriptBlob, on_delete=models.PROTECT, null=True, blank=True, related_name='+')
+    status = models.CharField(max_length=20, choices=ShootingSchedule.STATUS_CHOICES, default='completed')
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ['-date', '-time']
+        indexes = [models.Index(fields=['producer', 'date'])]
+
+    def __str__(self) -> str:
+        return f"{self.title} - {self.date} {self.time} (arsip)"
+
+    @property
+    def script(self) -> str:
+        return self.script_blob.text if self.script_blob_id else ''
+
+
+class ArchivedScheduleStats(StatsCounters):
+    """Salinan `ScheduleStats` saat jadwal diarsipkan (baris aslinya ikut terhapus)."""
+    schedule = models.OneToOneField(ArchivedSchedule, on_delete=models.CASCADE, related_name='stats')
+    producer = models.ForeignKey(User, on_delete=models.CASCADE, related_name='archived_schedule_stats')
+
+    class Meta:
+        verbose_name = 'Archived Schedule Stats'
+        verbose_name_plural = 'Archived Schedule Stats'
+
+    def __str__(self) -> str:
+        return f"Stats arsip {self.schedule_id}"
+
+
+class ArchivedApplication(models.Model):
+    schedule = models.ForeignKey(ArchivedSchedule, on_delete=models.CASCADE, related_name='applications')
+    actor = models.ForeignKey(User, on_delete=models.CASCADE, related_name='archived_applications')
+    status = models.CharField(max_length=16, choices=ScheduleApplication.STATUS_CHOICES)
+    submitted_at = models.DateTimeField()
+    responded_at = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self) -> str:
+        return f"{self.actor} pada {self.schedule} ({self.status})"
+
+
+class ArchivedSocialMediaTask(models.Model):
+    schedule = models.ForeignKey(ArchivedSchedule, on_delete=models.CASCADE, related_name='social_media_tasks')
+    editor = models.ForeignKey(User, on_delete=models.CASCADE, related_name='archived_tasks', null=True, blank=True)
+    social_media = models.CharField(max_length=20, choices=SocialMediaTask.SOCIAL_CHOICES)
+    caption = models.TextField()
+    film_title = models.CharField(max_length=200)
+    due_date = models.DateTimeField()
+    is_completed = models.BooleanField(default=False)
+    completed_at = models.DateTimeField(null=True, blank=True)
+    created_at = models.DateTimeField()
+
+    def __str__(self) -> str:
+        return f"{self.film_title} - {self.get_social_media_display()}"
+
+
+class ArchivedNotification(models.Model):
+    schedule = models.ForeignKey(ArchivedSchedule, on_delete=models.CASCADE, related_name='notifications')
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='archived_notifications')
+    kind = models.CharField(max_length=20, choices=Notification.KIND_CHOICES, default='general')
+    message = models.TextField()
+    is_read = models.BooleanField(default=False)
+    created_at = models.DateTimeField()
+
     def __str__(self) -> str:
         return f"{self.user} - {self.message[:40]}"
@@ -0,0 +1,173 @@
+"""Rekomendasi jadwal untuk aktor berbasis vektor fitur (NumPy).
+
+Setiap jadwal dipetakan ke vektor float32: lokasi dan produser di-hash ke
+bucket one-hot, ditambah bin waktu syuting (pagi/siang/sore/malam). Vektor aktor
+adalah jumlah vektor jadwal yang pernah ia ajukan, diberi bobot status
+(diterima positif, ditolak negatif — sehingga tingkat penerimaan ikut
+terhitung), lalu dinormalisasi. Keduanya dihitung oleh `refresh_recommendations`;
+saat request, peringkat cukup satu perkalian matriks.
+"""
+from __future__ import annotations
+import zlib
+from datetime import time
+from typing import Iterable
+
+import numpy as np
+from django.db.models import Q
+from django.utils import timezone
+
+from .analytics import purge_trail
+from .models import (
+    ActorFeatures, ApplicationTrail, ArchivedApplication, ScheduleApplication, ScheduleFeatures, ShootingSchedule, User, Watermark,
+)
+
+
+LOCATION_BUCKETS = 64
+PRODUCER_BUCKETS = 32
+TIME_BINS = (11, 15, 18)  # batas jam: pagi < 11 <= siang < 15 <= sore < 18 <= malam
+DIM = LOCATION_BUCKETS + PRODUCER_BUCKETS + len(TIME_BINS) + 1
+STATUS_WEIGHTS = {
+    'confirmed': 1.0,
+    'pending': 0.5,
+    'rejected': -0.5,
+}
+CHUNK_SIZE = 500
+
+
+def schedule_vector(location: str, producer_id: int, at: time) -> np.ndarray:
+    vector = np.zeros(DIM, dtype=np.float32)
+    vector[zlib.crc32(location.strip().lower().encode('utf-8')) % LOCATION_BUCKETS] = 1.0
+    vector[LOCATION_BUCKETS + producer_id % PRODUCER_BUCKETS] = 1.0
+    vector[LOCATION_BUCKETS + PRODUCER_BUCKETS + int(np.searchsorted(TIME_BINS, at.hour, side='right'))] = 1.0
+    return vector
+
+
+def _matrix(blobs: Iterable[bytes]) -> np.ndarray:
+    return np.frombuffer(b''.join(bytes(b) for b in blobs), dtype=np.float32).reshape(-1, DIM)
+
+
+def _chunks(values: list, size: int = CHUNK_SIZE) -> Iterable[list]:
+    for i in range(0, len(values), size):
+        yield values[i:i + size]
+
+
+def refresh_schedule_features(schedules) -> int:
+    """Hitung ulang vektor untuk queryset jadwal; mengembalikan jumlah baris."""
+    count = 0
+    rows = list(schedules.order_by().values_list('id', 'location', 'producer_id', 'time'))
+    for chunk in _chunks(rows):
+        ScheduleFeatures.objects.bulk_create(
+            [ScheduleFeatures(schedule_id=pk, vector=schedule_vector(location, producer_id, at).tobytes())
+             for pk, location, producer_id, at in chunk],
+            update_conflicts=True, unique_fields=['schedule'], update_fields=['vector', 'updated_at'],
+        )
+        count += len(chunk)
+    return count
+
+
+def refresh_actor_features(actor_ids: Iterable[int]) -> int:
+    count = 0
+    for chunk in _chunks(sorted(set(actor_ids))):
+        apps = list(
+            ScheduleApplication.objects.filter(actor_id__in=chunk).order_by()
+            .values_list('actor_id', 'schedule_id', 'status')
+        )
+        schedule_ids = sorted({schedule_id for _, schedule_id, _ in apps})
+        missing = set(schedule_ids) - set(
+            ScheduleFeatures.objects.filter(schedule_id__in=schedule_ids).values_list('schedule_id', flat=True)
+        )
+        if missing:
+            refresh_schedule_features(ShootingSchedule.objects.filter(id__in=missing))
+        features = dict(ScheduleFeatures.objects.filter(schedule_id__in=schedule_ids).values_list('schedule_id', 'vector'))
+        position = {pk: i for i, pk in enumerate(features)}
+        matrix = _matrix(features.values()) if features else np.zeros((0, DIM), dtype=np.float32)
+
+        # Riwayat yang sudah diarsipkan: jadwalnya tidak punya ScheduleFeatures, vektor dihitung di sini.
+        archived_vectors: dict[int, np.ndarray] = {}
+        archived_apps = []
+        for actor_id, schedule_id, status, location, producer_id, at in (
+            ArchivedApplication.objects.filter(actor_id__in=chunk).order_by()
+            .values_list('actor_id', 'schedule_id', 'status', 'schedule__location', 'schedule__producer_id', 'schedule__time')
+        ):
+            if schedule_id not in archived_vectors:
+                archived_vectors[schedule_id] = schedule_vector(location, producer_id, at)
+            archived_apps.append((actor_id, schedule_id, status))
+        archived_position = {pk: len(features) + i for i, pk in enumerate(archived_vectors)}
+        if archived_vectors:
+            matrix = np.vstack([matrix, np.stack(list(archived_vectors.values()))])
+
+        actor_index = {pk: i for i, pk in enumerate(chunk)}
+        rows = [(actor_index[a], position[s], STATUS_WEIGHTS.get(status, 0.0)) for a, s, status in apps if s in position]
+        rows += [(actor_index[a], archived_position[s], STATUS_WEIGHTS.get(status, 0.0)) for a, s, status in archived_apps]
+        vectors = np.zeros((len(chunk), DIM), dtype=np.float32)
+        totals = np.zeros(len(chunk), dtype=np.int64)
+        if rows:
+            actor_idx, schedule_idx, weights = (np.array(col) for col in zip(*rows))
+            np.add.at(vectors, actor_idx, matrix[schedule_idx] * weights[:, None].astype(np.float32))
+            np.add.at(totals, actor_idx, 1)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        vectors = np.divide(vectors, norms, out=np.zeros_like(vectors), where=norms > 0)
+        ActorFeatures.objects.bulk_create(
+            [ActorFeatures(actor_id=pk, vector=vectors[i].tobytes(), applications=int(totals[i]))
+             for pk, i in actor_index.items()],
+            update_conflicts=True, unique_fields=['actor'], update_fields=['vector', 'applications', 'updated_at'],
+        )
+        count += len(chunk)
+    return count
+
+
+def refresh(full: bool = False) -> tuple[int, int]:
+    """Perbarui vektor yang berubah sejak watermark `recommendations`.
+
+    Mengembalikan jumlah (jadwal, aktor) yang dihitung ulang.
+    """
+    now = timezone.now()
+    mark = None if full else Watermark.objects.filter(name='recommendations').first()
+    if mark is None:
+        schedules = ShootingSchedule.objects.all()
+        actor_ids = set(ScheduleApplication.objects.values_list('actor_id', flat=True).distinct())
+        actor_ids |= set(ArchivedApplication.objects.values_list('actor_id', flat=True).distinct())
+    else:
+        since = mark.value
+        schedules = ShootingSchedule.objects.filter(Q(updated_at__gte=since) | Q(features__isnull=True))
+        changed_ids = list(schedules.values_list('id', flat=True))
+        actor_ids = set(
+            ScheduleApplication.objects
+            .filter(Q(updated_at__gte=since) | Q(schedule_id__in=changed_ids))
+            .values_list('actor_id', flat=True).distinct()
+        )
+        # Pengajuan yang dihapus (leave, admin) tidak lagi terlihat di tabel pengajuan.
+        actor_ids |= set(
+            ApplicationTrail.objects.filter(recorded_at__gte=since, recorded_at__lt=now, actor_id__isnull=False)
+            .values_list('actor_id', flat=True).distinct()
+        )
+        schedules = ShootingSchedule.objects.filter(id__in=changed_ids)
+    refreshed = refresh_schedule_features(schedules), refresh_actor_features(actor_ids)
+    Watermark.objects.update_or_create(name='recommendations', defaults={'value': now})
+    purge_trail()
+    return refreshed
+
+
+def recommend(actor: User, candidates, limit: int = 20) -> list[int] | None:
+    """Urutkan id jadwal kandidat berdasarkan skor; `None` jika aktor belum punya riwayat."""
+    blob = ActorFeatures.objects.filter(actor=actor, applications__gt=0).values_list('vector', flat=True).first()
+    if blob is None:
+        return None
+    preference = np.frombuffer(bytes(blob), dtype=np.float32)
+    rows = list(candidates.order_by().values_list('id', 'features__vector'))
+    if not rows:
+        return []
+    missing = [pk for pk, vector in rows if vector is None]
+    if missing:
+        # Jadwal baru yang belum diproses command: hitung langsung (jumlahnya kecil).
+        fresh = {
+            pk: schedule_vector(location, producer_id, at).tobytes()
+            for pk, location, producer_id, at in ShootingSchedule.objects.filter(id__in=missing)
+            .values_list('id', 'location', 'producer_id', 'time')
+        }
+        rows = [(pk, vector if vector is not None else fresh[pk]) for pk, vector in rows]
+    ids = np.array([pk for pk, _ in rows])
+    scores = _matrix(vector for _, vector in rows) @ preference
+    # Skor sama: jadwal yang dibuat lebih dulu (id lebih kecil) didahulukan.
+    order = np.lexsort((ids, -scores))[:limit]
+    return ids[order].tolist()
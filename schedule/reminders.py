@@ -0,0 +1,188 @@
+"""Penjadwal reminder multi-window berbasis min-heap.
+
+`ReminderScheduler` menyimpan waktu reminder yang akan datang di memori dan
+hanya memuat ulang jadwal/task yang berubah sejak poll terakhir (`updated_at`).
+Entri lama tidak dihapus dari heap; entri dianggap basi bila target waktunya
+sudah tidak sama dengan versi terbaru objek. `dispatch` memvalidasi ulang ke
+database lalu mengklaim baris `ReminderLog` lebih dulu (`ignore_conflicts`); hanya
+reminder yang klaimnya berhasil yang dikirim, sehingga `run_scheduler` dan
+`send_reminders` aman berjalan bersamaan tanpa duplikat.
+"""
+from __future__ import annotations
+import heapq
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from .models import Notification, ReminderLog, ScheduleApplication, ShootingSchedule, SocialMediaTask
+
+
+SCHEDULE_WINDOWS = (
+    ('h-1', timedelta(days=1)),
+    ('h-3h', timedelta(hours=3)),
+)
+TASK_WINDOWS = (
+    ('due-1d', timedelta(days=1)),
+    ('due-1h', timedelta(hours=1)),
+)
+# Perubahan yang di-commit hampir bersamaan dengan poll tetap terbaca pada poll berikutnya.
+POLL_OVERLAP = timedelta(seconds=2)
+
+
+@dataclass(order=True, frozen=True)
+class Reminder:
+    fire_at: datetime
+    kind: str = field(compare=False)
+    object_id: int = field(compare=False)
+    window: str = field(compare=False)
+    target: datetime = field(compare=False)
+
+
+def schedule_start(schedule: ShootingSchedule) -> datetime:
+    return timezone.make_aware(datetime.combine(schedule.date, schedule.time))
+
+
+def schedule_reminders(schedule: ShootingSchedule) -> list[Reminder]:
+    start = schedule_start(schedule)
+    return [Reminder(start - offset, 'schedule', schedule.pk, window, start) for window, offset in SCHEDULE_WINDOWS]
+
+
+def task_reminders(task: SocialMediaTask) -> list[Reminder]:
+    return [Reminder(task.due_date - offset, 'task', task.pk, window, task.due_date) for window, offset in TASK_WINDOWS]
+
+
+class ReminderScheduler:
+    def __init__(self, grace: timedelta = timedelta(minutes=30)):
+        # Reminder yang terlewat lebih dari `grace` (mis. daemon mati) tidak dikirim lagi.
+        self.grace = grace
+        self.heap: list[Reminder] = []
+        self.targets: dict[tuple[str, int], datetime] = {}
+        self.last_poll: datetime | None = None
+
+    def __len__(self) -> int:
+        return len(self.heap)
+
+    def _track(self, key: tuple[str, int], target: datetime | None, reminders: list[Reminder], now: datetime) -> None:
+        if self.targets.get(key) == target:
+            return
+        if target is None:
+            self.targets.pop(key, None)
+            return
+        self.targets[key] = target
+        for reminder in reminders:
+            if reminder.fire_at >= now - self.grace:
+                heapq.heappush(self.heap, reminder)
+
+    def poll(self, now: datetime | None = None) -> int:
+        """Muat jadwal/task yang berubah sejak poll terakhir (semua yang akan datang pada poll pertama)."""
+        now = now or timezone.now()
+        schedules = ShootingSchedule.objects.only('id', 'date', 'time', 'status')
+        tasks = SocialMediaTask.objects.only('id', 'due_date', 'is_completed')
+        if self.last_poll is None:
+            schedules = schedules.filter(date__gte=timezone.localdate(now) - timedelta(days=1)).exclude(status='completed')
+            tasks = tasks.filter(due_date__gte=now - self.grace, is_completed=False)
+        else:
+            since = self.last_poll - POLL_OVERLAP
+            schedules = schedules.filter(updated_at__gte=since)
+            tasks = tasks.filter(updated_at__gte=since)
+        changed = 0
+        for schedule in schedules.iterator():
+            target = None if schedule.status == 'completed' else schedule_start(schedule)
+            self._track(('schedule', schedule.pk), target, schedule_reminders(schedule), now)
+            changed += 1
+        for task in tasks.iterator():
+            target = None if task.is_completed else task.due_date
+            self._track(('task', task.pk), target, task_reminders(task), now)
+            changed += 1
+        # Baru dimajukan setelah semua baris terbaca: poll yang gagal diulang dari titik yang sama.
+        self.last_poll = now
+        return changed
+
+    def requeue(self, reminders: list[Reminder]) -> None:
+        """Kembalikan reminder yang gagal dikirim ke heap agar dicoba lagi."""
+        for reminder in reminders:
+            heapq.heappush(self.heap, reminder)
+
+    def next_fire_at(self) -> datetime | None:
+        return self.heap[0].fire_at if self.heap else None
+
+    def pop_due(self, now: datetime | None = None) -> list[Reminder]:
+        now = now or timezone.now()
+        due = []
+        while self.heap and self.heap[0].fire_at <= now:
+            reminder = heapq.heappop(self.heap)
+            if self.targets.get((reminder.kind, reminder.object_id)) == reminder.target:
+                due.append(reminder)
+        return due
+
+
+def _schedule_message(window: str, schedule: ShootingSchedule) -> str:
+    when = 'Besok' if window == 'h-1' else '3 jam lagi'
+    return f"Reminder: {when} ada syuting '{schedule.title}' jam {schedule.time} di {schedule.location}"
+
+
+def _task_message(window: str, task: SocialMediaTask) -> str:
+    due = timezone.localtime(task.due_date)
+    return f"Reminder: Task '{task.film_title}' ({task.get_social_media_display()}) jatuh tempo {due:%d %b %H:%M}"
+
+
+def dispatch(reminders: list[Reminder]) -> int:
+    """Kirim reminder secara batch; yang basi atau sudah tercatat di `ReminderLog` dilewati."""
+    if not reminders:
+        return 0
+    keys = {(r.kind, r.object_id, r.window, r.target) for r in reminders}
+    schedule_ids = {r.object_id for r in reminders if r.kind == 'schedule'}
+    task_ids = {r.object_id for r in reminders if r.kind == 'task'}
+    with transaction.atomic():
+        logged = ReminderLog.objects.filter(
+            Q(kind='schedule', object_id__in=schedule_ids) | Q(kind='task', object_id__in=task_ids)
+        )
+        sent = set(logged.values_list('kind', 'object_id', 'window', 'target'))
+        schedules = ShootingSchedule.objects.exclude(status='completed').in_bulk(schedule_ids)
+        tasks = SocialMediaTask.objects.filter(is_completed=False).in_bulk(task_ids)
+        actors: dict[int, list[int]] = {}
+        for schedule_id, actor_id in ScheduleApplication.objects.filter(
+            schedule_id__in=schedule_ids, status='confirmed',
+        ).values_list('schedule_id', 'actor_id'):
+            actors.setdefault(schedule_id, []).append(actor_id)
+
+        pending: dict[tuple, list[Notification]] = {}
+        for key in keys - sent:
+            kind, object_id, window, target = key
+            if kind == 'schedule':
+                schedule = schedules.get(object_id)
+                if schedule is None or schedule_start(schedule) != target:
+                    continue
+                recipients = actors.get(object_id)
+                if not recipients:
+                    continue
+                message = _schedule_message(window, schedule)
+                pending[key] = [Notification(user_id=actor_id, schedule=schedule, message=message)
+                                for actor_id in recipients]
+            else:
+                task = tasks.get(object_id)
+                if task is None or task.due_date != target or task.editor_id is None:
+                    continue
+                pending[key] = [Notification(user_id=task.editor_id, schedule_id=task.schedule_id,
+                                             message=_task_message(window, task))]
+        if not pending:
+            return 0
+
+        # Klaim dulu: baris yang sudah disisipkan proses lain dilewati tanpa IntegrityError,
+        # lalu hanya reminder dengan token klaim milik kita yang dikirim.
+        claim = uuid.uuid4()
+        ReminderLog.objects.bulk_create(
+            [ReminderLog(kind=kind, object_id=object_id, window=window, target=target, claim=claim)
+             for kind, object_id, window, target in pending],
+            ignore_conflicts=True,
+        )
+        claimed = set(
+            logged.filter(claim=claim).values_list('kind', 'object_id', 'window', 'target')
+        )
+        notifications = [n for key, batch in pending.items() if key in claimed for n in batch]
+        Notification.objects.bulk_create(notifications)
+    return len(notifications)
@@ -0,0 +1,52 @@
+"""Penyimpanan naskah content-addressed: teks di-hash, dikompresi, dan dideduplikasi."""
+from __future__ import annotations
+import hashlib
+import zlib
+
+from django.db import transaction
+from django.db.models import Max
+from django.utils import timezone
+
+from .models import ScriptBlob, ScriptVersion, ShootingSchedule
+
+
+COMPRESSION_LEVEL = 6
+
+
+def digest_of(text: str) -> str:
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def get_or_create_blob(text: str) -> ScriptBlob:
+    raw = text.encode('utf-8')
+    blob, _ = ScriptBlob.objects.get_or_create(
+        digest=hashlib.sha256(raw).hexdigest(),
+        defaults={'data': zlib.compress(raw, COMPRESSION_LEVEL), 'size': len(raw)},
+    )
+    return blob
+
+
+def store_script(schedule: ShootingSchedule, text: str) -> ScriptVersion | None:
+    """Simpan `text` sebagai versi baru naskah jadwal jika isinya berubah.
+
+    Naskah kosong melepas referensi versi; riwayat versi sebelumnya tetap ada.
+    Hanya kolom `script_version`/`updated_at` yang ditulis pada baris jadwal.
+    """
+    current = schedule.script_version
+    if not text:
+        if current is None:
+            return None
+        version = None
+    elif current is not None and current.blob_id == digest_of(text):
+        return current
+    else:
+        with transaction.atomic():
+            blob = get_or_create_blob(text)
+            last = schedule.script_versions.aggregate(n=Max('number'))['n'] or 0
+            version = ScriptVersion.objects.create(schedule=schedule, blob=blob, number=last + 1)
+    schedule.script_version = version
+    schedule.updated_at = timezone.now()
+    ShootingSchedule.objects.filter(pk=schedule.pk).update(
+        script_version=version, updated_at=schedule.updated_at,
+    )
+    return version
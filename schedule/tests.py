@@ -0,0 +1,341 @@
+import base64
+from datetime import date, time, timedelta
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from . import actions, analytics, archive, recommendations
+from .forms import ShootingScheduleForm
+from .models import (
+    ActorFeatures, ArchivedApplication, ArchivedNotification, ArchivedSchedule, ArchivedScheduleStats,
+    ArchivedSocialMediaTask, DailyStats, Notification, ReminderLog, ScheduleApplication, ScheduleStats, ShootingSchedule,
+    ScriptBlob, SocialMediaTask, User,
+)
+from .reminders import ReminderScheduler, dispatch, schedule_start
+from .scripts import store_script
+
+
+class ApiTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.producer = User.objects.create_user('producer', password='x', role='producer')
+        # Tanggal dan jam sama: urutan ditentukan oleh id (kolom terakhir keyset).
+        cls.schedules = [
+            ShootingSchedule.objects.create(
+                producer=cls.producer, title=f'Syuting {i}', date=date(2030, 1, 1), time=time(9),
+                location='Studio', status='available',
+            )
+            for i in range(5)
+        ]
+
+    def setUp(self):
+        self.client.force_login(self.producer)
+
+    def test_cursor_pages_through_equal_date_and_time(self):
+        url, params, seen = reverse('api_schedules'), {'limit': 2, 'fields': 'id'}, []
+        while True:
+            body = self.client.get(url, params).json()
+            seen += [row['id'] for row in body['data']]
+            if not body['next']:
+                break
+            params['cursor'] = body['next']
+        self.assertEqual(seen, sorted(s.pk for s in self.schedules))
+
+    def test_crafted_cursor_returns_400(self):
+        url = reverse('api_schedules')
+        for values in ('[null,null,null]', '[{},1,2]', '["x","y","z"]', '["2030-01-01","09:00","x"]', '[1,2]'):
+            cursor = base64.urlsafe_b64encode(values.encode()).decode().rstrip('=')
+            response = self.client.get(url, {'cursor': cursor})
+            self.assertEqual(response.status_code, 400, values)
+            self.assertEqual(response.json(), {'error': 'Cursor tidak valid.'})
+
+    def test_unchanged_page_returns_304(self):
+        url = reverse('api_schedules')
+        first = self.client.get(url)
+        self.assertEqual(first.status_code, 200)
+        again = self.client.get(url, HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(again.status_code, 304)
+        self.assertEqual(again.content, b'')
+
+        ShootingSchedule.objects.filter(pk=self.schedules[0].pk).update(updated_at=timezone.now() + timedelta(seconds=1))
+        changed = self.client.get(url, HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(changed.status_code, 200)
+
+    def test_completing_via_html_view_invalidates_etag(self):
+        schedule = self.schedules[0]
+        url = reverse('api_schedule_detail', args=[schedule.pk])
+        first = self.client.get(url)
+        self.assertEqual(first.json()['data']['status'], 'available')
+
+        self.client.post(reverse('complete_schedule', args=[schedule.pk]))
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['data']['status'], 'completed')
+
+    def test_missing_object_returns_json_404(self):
+        response = self.client.patch(
+            reverse('api_schedule_detail', args=[999999]), '{}', content_type='application/json',
+        )
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(response.json(), {'error': 'Tidak ditemukan.'})
+
+    def test_form_encoded_patch_is_rejected(self):
+        schedule = self.schedules[0]
+        response = self.client.patch(
+            reverse('api_schedule_detail', args=[schedule.pk]), 'title=Baru',
+            content_type='application/x-www-form-urlencoded',
+        )
+        self.assertEqual(response.status_code, 415)
+        schedule.refresh_from_db()
+        self.assertEqual(schedule.title, 'Syuting 0')
+
+
+class AnalyticsTests(TestCase):
+    def test_incremental_catch_up_sees_status_edits_and_deletions(self):
+        producer = User.objects.create_user('producer', password='x', role='producer')
+        schedule = ShootingSchedule.objects.create(
+            producer=producer, title='Syuting', date=date(2030, 1, 1), time=time(9), location='Studio',
+        )
+        apps = [
+            ScheduleApplication.objects.create(
+                schedule=schedule, actor=User.objects.create_user(f'actor{i}', password='x', role='actor'),
+            )
+            for i in range(3)
+        ]
+        analytics.catch_up(full=True)
+
+        # Perubahan di luar view: hanya status/responded_at, lalu satu pengajuan dihapus.
+        apps[0].status, apps[0].responded_at = 'confirmed', timezone.now()
+        apps[0].save()
+        apps[1].delete()
+        analytics.catch_up()
+
+        stats = ScheduleStats.objects.get(schedule=schedule)
+        self.assertEqual((stats.applicants, stats.confirmed), (2, 1))
+
+    def _responded_totals(self) -> tuple[int, int]:
+        rows = DailyStats.objects.all()
+        return sum(r.confirmed for r in rows), sum(r.rejected for r in rows)
+
+    def test_second_response_moves_out_of_the_old_day(self):
+        admin_user = User.objects.create_superuser('admin', password='x')
+        producer = User.objects.create_user('producer', password='x', role='producer')
+        actor = User.objects.create_user('actor', password='x', role='actor')
+        schedule = ShootingSchedule.objects.create(
+            producer=producer, title='Syuting', date=date(2030, 1, 1), time=time(9), location='Studio',
+        )
+        application = ScheduleApplication.objects.create(
+            schedule=schedule, actor=actor, status='confirmed', responded_at=timezone.now() - timedelta(days=5),
+        )
+        analytics.catch_up(full=True)
+        self.assertEqual(self._responded_totals(), (1, 0))
+
+        # Aksi massal admin memakai QuerySet.update(), bukan save().
+        self.client.force_login(admin_user)
+        self.client.post(reverse('admin:schedule_scheduleapplication_changelist'), {
+            'action': 'reject_applications', '_selected_action': [application.pk],
+        })
+        analytics.catch_up()
+        self.assertEqual(self._responded_totals(), (0, 1))
+
+        # Lewat save(): respons lama dicatat oleh receiver pre_save.
+        application.refresh_from_db()
+        application.status, application.responded_at = 'confirmed', timezone.now() + timedelta(days=1)
+        application.save()
+        analytics.catch_up()
+        self.assertEqual(self._responded_totals(), (1, 0))
+
+        analytics.catch_up(full=True)
+        self.assertEqual(self._responded_totals(), (1, 0))
+
+
+class ScheduleChangeNotificationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.producer = User.objects.create_user('producer', password='x', role='producer')
+        cls.schedule = ShootingSchedule.objects.create(
+            producer=cls.producer, title='Syuting', date=date(2030, 1, 1), time=time(9), location='Studio A',
+        )
+        cls.recipients = set()
+        for i, status in enumerate(('confirmed', 'confirmed', 'pending', 'rejected')):
+            actor = User.objects.create_user(f'actor{i}', password='x', role='actor')
+            ScheduleApplication.objects.create(schedule=cls.schedule, actor=actor, status=status)
+            if status == 'confirmed':
+                cls.recipients.add(actor.pk)
+        editor = User.objects.create_user('editor', password='x', role='editor')
+        SocialMediaTask.objects.create(
+            schedule=cls.schedule, editor=editor, social_media='instagram', caption='-', film_title='Film',
+            due_date=timezone.now() + timedelta(days=7),
+        )
+        cls.recipients.add(editor.pk)
+
+    def _edit(self, **changes) -> None:
+        schedule = ShootingSchedule.objects.get(pk=self.schedule.pk)
+        data = {
+            'title': schedule.title, 'date': schedule.date, 'time': schedule.time,
+            'location': schedule.location, 'description': schedule.description, 'script': schedule.script,
+        } | changes
+        form = ShootingScheduleForm(data, instance=schedule)
+        self.assertTrue(form.is_valid(), form.errors)
+        with self.captureOnCommitCallbacks(execute=True):
+            form.save()
+
+    def _changes(self):
+        return Notification.objects.filter(schedule=self.schedule, kind='schedule_change')
+
+    def test_title_only_edit_sends_nothing(self):
+        self._edit(title='Judul Baru')
+        self.assertFalse(self._changes().exists())
+
+    def test_location_edit_notifies_participants_in_one_insert(self):
+        with CaptureQueriesContext(connection) as queries:
+            self._edit(location='Studio B')
+        inserts = [q for q in queries.captured_queries if q['sql'].startswith('INSERT INTO "schedule_notification"')]
+        self.assertEqual(len(inserts), 1)
+        self.assertEqual(set(self._changes().values_list('user_id', flat=True)), self.recipients)
+
+    def test_second_edit_within_window_updates_unread_rows(self):
+        self._edit(location='Studio B')
+        self._edit(location='Studio C')
+        self.assertEqual(self._changes().count(), len(self.recipients))
+        self.assertTrue(all('Studio C' in message for message in self._changes().values_list('message', flat=True)))
+
+
+class ArchiveTests(TestCase):
+    def test_archive_chunk_moves_rows_to_archive_tables(self):
+        producer = User.objects.create_user('producer', password='x', role='producer')
+        actor = User.objects.create_user('actor', password='x', role='actor')
+        editor = User.objects.create_user('editor', password='x', role='editor')
+        schedule = ShootingSchedule.objects.create(
+            producer=producer, title='Syuting', date=date(2020, 1, 1), time=time(9), location='Studio',
+            status='completed',
+        )
+        store_script(schedule, 'INT. STUDIO - PAGI')
+        ScheduleApplication.objects.create(
+            schedule=schedule, actor=actor, status='confirmed', responded_at=timezone.now(),
+        )
+        SocialMediaTask.objects.create(
+            schedule=schedule, editor=editor, social_media='tiktok', caption='-', film_title='Film',
+            due_date=timezone.now(),
+        )
+        Notification.objects.create(user=actor, schedule=schedule, message='Reminder')
+        analytics.rebuild_schedule_stats([schedule.pk])
+
+        self.assertEqual(archive.archive_chunk([schedule.pk]), 3)
+
+        archived = ArchivedSchedule.objects.get(original_id=schedule.pk)
+        self.assertEqual(ArchivedApplication.objects.get().schedule_id, archived.pk)
+        self.assertEqual(ArchivedSocialMediaTask.objects.get().schedule_id, archived.pk)
+        self.assertEqual(ArchivedNotification.objects.get().schedule_id, archived.pk)
+        stats = ArchivedScheduleStats.objects.get(schedule=archived)
+        self.assertEqual((stats.applicants, stats.confirmed), (1, 1))
+
+        self.assertFalse(ShootingSchedule.objects.filter(pk=schedule.pk).exists())
+        self.assertFalse(ScheduleApplication.objects.exists())
+        self.assertFalse(SocialMediaTask.objects.exists())
+        self.assertFalse(Notification.objects.exists())
+        self.assertFalse(ScheduleStats.objects.exists())
+        self.assertTrue(ScriptBlob.objects.filter(pk=archived.script_blob_id).exists())
+        self.assertEqual(archived.script, 'INT. STUDIO - PAGI')
+
+
+class RecommendationTests(TestCase):
+    def test_withdrawn_application_leaves_actor_vector_incrementally(self):
+        producer = User.objects.create_user('producer', password='x', role='producer')
+        actor = User.objects.create_user('actor', password='x', role='actor')
+        schedule = ShootingSchedule.objects.create(
+            producer=producer, title='Syuting', date=date(2030, 1, 1), time=time(9), location='Studio',
+        )
+        application = actions.apply_to_schedule(schedule, actor)
+        recommendations.refresh(full=True)
+        self.assertEqual(ActorFeatures.objects.get(actor=actor).applications, 1)
+
+        actions.withdraw_application(application)
+        recommendations.refresh()
+        self.assertEqual(ActorFeatures.objects.get(actor=actor).applications, 0)
+        self.assertIsNone(recommendations.recommend(actor, ShootingSchedule.objects.all()))
+
+
+class ReminderTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.producer = User.objects.create_user('producer', password='x', role='producer')
+        cls.actor = User.objects.create_user('actor', password='x', role='actor')
+
+    def setUp(self):
+        self.now = timezone.now().replace(microsecond=0)
+        start = timezone.localtime(self.now + timedelta(days=2))
+        self.schedule = ShootingSchedule.objects.create(
+            producer=self.producer, title='Syuting', date=start.date(), time=start.time(),
+            location='Studio', status='available',
+        )
+        ScheduleApplication.objects.create(schedule=self.schedule, actor=self.actor, status='confirmed')
+
+    def test_moved_schedule_leaves_old_reminder_stale(self):
+        scheduler = ReminderScheduler()
+        scheduler.poll(self.now)
+        old_start = schedule_start(self.schedule)
+
+        moved = timezone.localtime(old_start + timedelta(hours=5))
+        self.schedule.date, self.schedule.time = moved.date(), moved.time()
+        self.schedule.save()
+        scheduler.poll(timezone.now() + timedelta(seconds=1))
+
+        # Sampai H-1 jadwal lama: entri lama sudah jatuh tempo tetapi basi.
+        self.assertEqual(scheduler.pop_due(old_start - timedelta(days=1)), [])
+        due = scheduler.pop_due(schedule_start(self.schedule) - timedelta(days=1))
+        self.assertEqual([(r.window, r.target) for r in due], [('h-1', schedule_start(self.schedule))])
+
+    def test_dispatch_twice_sends_nothing_the_second_time(self):
+        scheduler = ReminderScheduler()
+        scheduler.poll(self.now)
+        due = scheduler.pop_due(schedule_start(self.schedule) - timedelta(days=1))
+        self.assertEqual(dispatch(due), 1)
+        self.assertEqual(dispatch(due), 0)
+        self.assertEqual(Notification.objects.filter(user=self.actor).count(), 1)
+        self.assertEqual(ReminderLog.objects.count(), 1)
+
+
+class ThrottleTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.staff = User.objects.create_user('staff', password='x', is_staff=True)
+
+    def setUp(self):
+        cache.clear()
+
+    def _shared_metrics(self) -> dict:
+        client = self.client_class()
+        client.force_login(self.staff)
+        return client.get(reverse('throttle_metrics')).json()['shared']
+
+    def test_login_burst_is_limited_per_user(self):
+        # Default: 5 percobaan per menit per username.
+        statuses = [
+            self.client.post(reverse('login'), {'username': 'actor', 'password': 'salah'}).status_code
+            for _ in range(6)
+        ]
+        self.assertEqual(statuses, [200] * 5 + [429])
+        response = self.client.post(reverse('login'), {'username': 'actor', 'password': 'salah'})
+        self.assertEqual(response.status_code, 429)
+        self.assertGreaterEqual(int(response['Retry-After']), 1)
+
+        metrics = self._shared_metrics()
+        self.assertEqual(metrics['login.allowed'], 5)
+        self.assertEqual(metrics['login.limited_user'], 2)
+
+    def test_get_requests_skip_the_throttle(self):
+        for _ in range(10):
+            self.assertEqual(self.client.get(reverse('login')).status_code, 200)
+        self.assertEqual(self._shared_metrics(), {})
+
+    @override_settings(THROTTLE_CONCURRENCY={'login': 0})
+    def test_requests_over_the_concurrency_limit_are_shed(self):
+        response = self.client.post(reverse('login'), {'username': 'actor', 'password': 'salah'})
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(response['Retry-After'], '1')
+        self.assertEqual(self._shared_metrics(), {'login.shed': 1})
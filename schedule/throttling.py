@@ -0,0 +1,189 @@
+"""Rate limiting token-bucket dan load shedding untuk view yang mahal (login, join).
+
+Bucket disimpan di cache Django (`THROTTLE_CACHE_ALIAS`) agar dibagi antar
+worker; jika cache gagal, dipakai bucket di memori proses. Selain itu setiap
+scope punya batas request bersamaan per proses (`THROTTLE_CONCURRENCY`): bila
+terlampaui, request langsung ditolak 429 tanpa menyentuh database/hash password.
+Konfigurasi default ada di bawah dan dapat ditimpa lewat settings.
+"""
+from __future__ import annotations
+import threading
+import time
+from collections import Counter
+from functools import wraps
+from typing import Callable
+
+from django.conf import settings
+from django.core.cache import caches
+from django.http import HttpRequest, HttpResponse, JsonResponse
+
+
+DEFAULT_RATES = {
+    'login': {'ip': '30/min', 'user': '5/min'},
+    'join': {'ip': '120/min', 'user': '20/min'},
+}
+DEFAULT_CONCURRENCY = {
+    'login': 8,
+    'join': 32,
+}
+PERIODS = {'sec': 1, 'min': 60, 'hour': 3600, 'day': 86400}
+CACHE_PREFIX = 'throttle'
+
+
+def parse_rate(rate: str) -> tuple[int, float]:
+    """'5/min' -> (kapasitas bucket, token per detik)."""
+    count, _, unit = rate.partition('/')
+    capacity = int(count)
+    return capacity, capacity / PERIODS[unit.strip()]
+
+
+class Metrics:
+    """Penghitung per proses; juga dijumlahkan ke cache (best effort) untuk total antar worker."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts: Counter[str] = Counter()
+
+    def incr(self, scope: str, event: str) -> None:
+        key = f'{scope}.{event}'
+        with self._lock:
+            self._counts[key] += 1
+        cache = caches[getattr(settings, 'THROTTLE_CACHE_ALIAS', 'default')]
+        try:
+            cache.add(f'{CACHE_PREFIX}:metrics:{key}', 0, None)
+            cache.incr(f'{CACHE_PREFIX}:metrics:{key}')
+        except Exception:
+            pass
+
+    @staticmethod
+    def keys() -> list[str]:
+        """Semua kunci `scope.event` yang mungkin, dari konfigurasi (bukan dari yang pernah dilihat proses ini)."""
+        rates = getattr(settings, 'THROTTLE_RATES', DEFAULT_RATES)
+        concurrency = getattr(settings, 'THROTTLE_CONCURRENCY', DEFAULT_CONCURRENCY)
+        keys = []
+        for scope in sorted(set(rates) | set(concurrency) | set(DEFAULT_RATES)):
+            events = ['allowed', 'shed'] + [f'limited_{kind}' for kind in rates.get(scope, {})]
+            keys += [f'{scope}.{event}' for event in events]
+        return keys
+
+    def snapshot(self) -> dict[str, dict[str, int]]:
+        with self._lock:
+            local = dict(self._counts)
+        cache = caches[getattr(settings, 'THROTTLE_CACHE_ALIAS', 'default')]
+        try:
+            shared = cache.get_many([f'{CACHE_PREFIX}:metrics:{key}' for key in dict.fromkeys(self.keys() + list(local))])
+        except Exception:
+            shared = {}
+        return {
+            'process': local,
+            'shared': {key.removeprefix(f'{CACHE_PREFIX}:metrics:'): value for key, value in shared.items()},
+        }
+
+
+class TokenBucketStore:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._local: dict[str, tuple[float, float]] = {}
+
+    @staticmethod
+    def _take(state: tuple[float, float] | None, capacity: int, refill: float, now: float) -> tuple[tuple[float, float], float]:
+        tokens, stamp = state if state else (float(capacity), now)
+        tokens = min(capacity, tokens + (now - stamp) * refill)
+        if tokens >= 1:
+            return (tokens - 1, now), 0.0
+        return (tokens, now), (1 - tokens) / refill
+
+    def take(self, key: str, capacity: int, refill: float) -> float:
+        """Ambil satu token; mengembalikan detik tunggu (0 jika diizinkan)."""
+        now = time.time()
+        timeout = int(capacity / refill) + 1
+        try:
+            # Baca-ubah-tulis tanpa lock lintas proses: cukup untuk throttling (bisa lolos 1-2 request ekstra).
+            cache = caches[getattr(settings, 'THROTTLE_CACHE_ALIAS', 'default')]
+            state, wait = self._take(cache.get(key), capacity, refill, now)
+            cache.set(key, state, timeout)
+            return wait
+        except Exception:
+            with self._lock:
+                state, wait = self._take(self._local.get(key), capacity, refill, now)
+                self._local[key] = state
+                return wait
+
+
+class ConcurrencyGate:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._in_flight: Counter[str] = Counter()
+
+    def enter(self, scope: str, limit: int) -> bool:
+        with self._lock:
+            if self._in_flight[scope] >= limit:
+                return False
+            self._in_flight[scope] += 1
+            return True
+
+    def leave(self, scope: str) -> None:
+        with self._lock:
+            self._in_flight[scope] -= 1
+
+
+metrics = Metrics()
+buckets = TokenBucketStore()
+gate = ConcurrencyGate()
+
+
+def client_ip(request: HttpRequest) -> str:
+    if getattr(settings, 'THROTTLE_TRUST_X_FORWARDED_FOR', False):
+        forwarded = request.headers.get('X-Forwarded-For', '')
+        if forwarded:
+            return forwarded.split(',')[0].strip()
+    return request.META.get('REMOTE_ADDR', '')
+
+
+def _user_key(request: HttpRequest) -> str | None:
+    if request.user.is_authenticated:
+        return f'id:{request.user.pk}'
+    username = request.POST.get('username', '').strip().lower()
+    return f'name:{username}' if username else None
+
+
+def too_many_requests(request: HttpRequest, retry_after: float) -> HttpResponse:
+    seconds = max(1, int(retry_after + 0.999))
+    message = 'Terlalu banyak permintaan. Silakan coba lagi sebentar lagi.'
+    if request.path.startswith('/api/') or 'application/json' in request.headers.get('Accept', ''):
+        response = JsonResponse({'error': message, 'retry_after': seconds}, status=429)
+    else:
+        response = HttpResponse(message, status=429, content_type='text/plain; charset=utf-8')
+    response['Retry-After'] = str(seconds)
+    return response
+
+
+def throttle(scope: str, methods: tuple[str, ...] = ('POST',)) -> Callable:
+    """Decorator view: token bucket per IP dan per user, plus batas konkurensi per proses."""
+    def decorator(view: Callable) -> Callable:
+        @wraps(view)
+        def wrapper(request: HttpRequest, *args, **kwargs) -> HttpResponse:
+            if request.method not in methods:
+                return view(request, *args, **kwargs)
+            rates = getattr(settings, 'THROTTLE_RATES', DEFAULT_RATES).get(scope, {})
+            limit = getattr(settings, 'THROTTLE_CONCURRENCY', DEFAULT_CONCURRENCY).get(scope)
+            if limit is not None and not gate.enter(scope, limit):
+                metrics.incr(scope, 'shed')
+                return too_many_requests(request, 1)
+            try:
+                identities = {'ip': client_ip(request), 'user': _user_key(request)}
+                for kind, rate in rates.items():
+                    ident = identities.get(kind)
+                    if not ident:
+                        continue
+                    wait = buckets.take(f'{CACHE_PREFIX}:{scope}:{kind}:{ident}', *parse_rate(rate))
+                    if wait:
+                        metrics.incr(scope, f'limited_{kind}')
+                        return too_many_requests(request, wait)
+                metrics.incr(scope, 'allowed')
+                return view(request, *args, **kwargs)
+            finally:
+                if limit is not None:
+                    gate.leave(scope)
+        return wrapper
+    return decorator
@@ -1,20 +1,24 @@
 from django.urls import path
-from . import views
+from . import api, views
 
 urlpatterns = [
     path('', views.login_view, name='login'),
     path('login/', views.login_view, name='login'),
     path('register/', views.register_view, name='register'),
     path('logout/', views.logout_view, name='logout'),
+    path('metrics/throttle/', views.throttle_metrics_view, name='throttle_metrics'),
 
     path('dashboard/', views.dashboard_view, name='dashboard'),
     path('producer/', views.producer_dashboard, name='producer_dashboard'),
+    path('producer/archive/', views.producer_archive, name='producer_archive'),
+    path('producer/analytics/', views.producer_analytics, name='producer_analytics'),
     path('editor/', views.editor_dashboard, name='editor_dashboard'),
 
     # Actor pages
     path('actor/', views.actor_dashboard, name='actor_dashboard'),  # redirects to my page
     path('actor/my/', views.actor_my_schedules, name='actor_my_schedules'),
     path('actor/available/', views.actor_available_schedules, name='actor_available_schedules'),
+    path('actor/recommended/', views.actor_recommended_schedules, name='actor_recommended_schedules'),
 
     # Schedule actions
     path('schedule/create/', views.create_schedule, name='create_schedule'),
@@ -31,4 +35,16 @@ urlpatterns = [
 
     # Social Media Tasks
     path('social_task/<int:task_id>/complete/', views.complete_social_task, name='complete_social_task'),
+
+    # JSON API v1 (mobile)
+    path('api/v1/schedules/', api.schedules, name='api_schedules'),
+    path('api/v1/schedules/<int:pk>/', api.schedule_detail, name='api_schedule_detail'),
+    path('api/v1/schedules/<int:pk>/join/', api.join_schedule, name='api_join_schedule'),
+    path('api/v1/applications/', api.applications, name='api_applications'),
+    path('api/v1/applications/<int:app_id>/approve/', api.respond_application, {'status': 'confirmed'}, name='api_approve_application'),
+    path('api/v1/applications/<int:app_id>/reject/', api.respond_application, {'status': 'rejected'}, name='api_reject_application'),
+    path('api/v1/tasks/', api.tasks, name='api_tasks'),
+    path('api/v1/tasks/<int:task_id>/complete/', api.complete_task, name='api_complete_task'),
+    path('api/v1/notifications/', api.notifications, name='api_notifications'),
+    path('api/v1/notifications/<int:pk>/read/', api.read_notification, name='api_read_notification'),
 ]
@@ -1,13 +1,27 @@
 from __future__ import annotations
 from django.contrib import messages
 from django.contrib.auth import login, logout
+from django.contrib.admin.views.decorators import staff_member_required
 from django.contrib.auth.decorators import login_required
-from django.http import HttpRequest, HttpResponse, HttpResponseForbidden, Http404
+from django.core.paginator import Paginator
+from django.db.models import Prefetch
+from django.http import HttpRequest, HttpResponse, HttpResponseForbidden, Http404, JsonResponse
 from django.shortcuts import get_object_or_404, redirect, render
 from django.utils import timezone
 
+from . import actions, analytics, recommendations
 from .forms import RegistrationForm, LoginForm, ShootingScheduleForm
-from .models import ShootingSchedule, ScheduleApplication, SocialMediaTask, User, Notification
+from .models import (
+    ShootingSchedule, ScheduleApplication, SocialMediaTask, User, DailyStats,
+    ArchivedSchedule, ArchivedApplication,
+)
+from .throttling import metrics as throttle_metrics, throttle
+
+
+ANALYTICS_DAYS = 30
+ANALYTICS_SCHEDULES = 50
+RECOMMENDATION_LIMIT = 20
+ARCHIVE_PAGE_SIZE = 20
 
 
 def register_view(request: HttpRequest) -> HttpResponse:
@@ -26,6 +40,7 @@ def register_view(request: HttpRequest) -> HttpResponse:
     return render(request, 'schedule/register.html', {'form': form})
 
 
+@throttle('login')
 def login_view(request: HttpRequest) -> HttpResponse:
     if request.user.is_authenticated:
         return redirect('dashboard')
@@ -42,6 +57,11 @@ def login_view(request: HttpRequest) -> HttpResponse:
     return render(request, 'schedule/login.html', {'form': form})
 
 
+@staff_member_required
+def throttle_metrics_view(request: HttpRequest) -> HttpResponse:
+    return JsonResponse(throttle_metrics.snapshot())
+
+
 def logout_view(request: HttpRequest) -> HttpResponse:
     logout(request)
     messages.info(request, 'Anda telah logout.')
@@ -67,6 +87,7 @@ def producer_dashboard(request: HttpRequest) -> HttpResponse:
         ShootingSchedule.objects
         .filter(producer=user)
         .order_by('date', 'time')
+        .select_related('script_version__blob')
         .prefetch_related('applications__actor')
     )
     tomorrow = timezone.localdate() + timezone.timedelta(days=1)
@@ -81,6 +102,57 @@ def producer_dashboard(request: HttpRequest) -> HttpResponse:
     })
 
 
+@login_required
+def producer_archive(request: HttpRequest) -> HttpResponse:
+    user: User = request.user  # type: ignore
+    if user.role != 'producer':
+        return HttpResponseForbidden('Hanya produser yang dapat mengakses halaman ini.')
+    archived = (
+        ArchivedSchedule.objects
+        .filter(producer=user)
+        .order_by('-date', '-time')
+        .select_related('script_blob')
+        .prefetch_related(Prefetch(
+            'applications',
+            queryset=ArchivedApplication.objects.filter(status='confirmed').select_related('actor'),
+            to_attr='confirmed_applications',
+        ))
+    )
+    page = Paginator(archived, ARCHIVE_PAGE_SIZE).get_page(request.GET.get('page'))
+    return render(request, 'schedule/producer_archive.html', {
+        'page': page,
+        'reminders': [],
+    })
+
+
+@login_required
+def producer_analytics(request: HttpRequest) -> HttpResponse:
+    user: User = request.user  # type: ignore
+    if user.role != 'producer':
+        return HttpResponseForbidden('Hanya produser yang dapat mengakses halaman ini.')
+    # Hanya membaca tabel ringkasan (dibatasi jumlah baris), bukan GROUP BY atas riwayat.
+    since = timezone.localdate() - timezone.timedelta(days=ANALYTICS_DAYS - 1)
+    daily = list(DailyStats.objects.filter(producer=user, day__gte=since).order_by('-day'))
+    totals = DailyStats(producer=user, day=timezone.localdate())
+    for row in daily:
+        for field in analytics.COUNTER_FIELDS:
+            setattr(totals, field, getattr(totals, field) + getattr(row, field))
+    # Diurutkan dari sisi jadwal agar indeks (producer, date, time) dipakai tanpa sort.
+    schedule_stats = [
+        schedule.stats for schedule in
+        ShootingSchedule.objects
+        .filter(producer=user, stats__isnull=False)
+        .select_related('stats')
+        .order_by('-date', '-time')[:ANALYTICS_SCHEDULES]
+    ]
+    return render(request, 'schedule/producer_analytics.html', {
+        'daily': daily,
+        'totals': totals,
+        'schedule_stats': schedule_stats,
+        'days': ANALYTICS_DAYS,
+    })
+
+
 @login_required
 def actor_dashboard(request: HttpRequest) -> HttpResponse:
     # Backwards compatibility: redirect to "Jadwal Saya"
@@ -92,7 +164,7 @@ def actor_my_schedules(request: HttpRequest) -> HttpResponse:
     user: User = request.user  # type: ignore
     if user.role != 'actor':
         return HttpResponseForbidden('Hanya aktor yang dapat mengakses halaman ini.')
-    my_apps = ScheduleApplication.objects.filter(actor=user).select_related("schedule").order_by("-submitted_at")
+    my_apps = ScheduleApplication.objects.filter(actor=user).select_related("schedule__script_version__blob").order_by("-submitted_at")
     tomorrow = timezone.localdate() + timezone.timedelta(days=1)
     reminders = [app.schedule for app in my_apps if app.status == 'confirmed' and app.schedule.date == tomorrow]
     return render(request, 'schedule/actor_my_schedules.html', {
@@ -107,7 +179,7 @@ def actor_available_schedules(request: HttpRequest) -> HttpResponse:
     if user.role != 'actor':
         return HttpResponseForbidden('Hanya aktor yang dapat mengakses halaman ini.')
     # Jadwal available, dan user BELUM punya ScheduleApplication apapun untuk jadwal itu
-    all_available = ShootingSchedule.objects.filter(status='available')
+    all_available = ShootingSchedule.objects.filter(status='available').select_related('script_version__blob')
     already_applied = ScheduleApplication.objects.filter(actor=user).values_list('schedule_id', flat=True)
     available_schedules = all_available.exclude(id__in=already_applied)
     tomorrow = timezone.localdate() + timezone.timedelta(days=1)
@@ -118,6 +190,28 @@ def actor_available_schedules(request: HttpRequest) -> HttpResponse:
     })
 
 
+@login_required
+def actor_recommended_schedules(request: HttpRequest) -> HttpResponse:
+    user: User = request.user  # type: ignore
+    if user.role != 'actor':
+        return HttpResponseForbidden('Hanya aktor yang dapat mengakses halaman ini.')
+    already_applied = ScheduleApplication.objects.filter(actor=user).values_list('schedule_id', flat=True)
+    candidates = ShootingSchedule.objects.filter(status='available').exclude(id__in=already_applied)
+    ranked = recommendations.recommend(user, candidates, limit=RECOMMENDATION_LIMIT)
+    schedules = candidates.select_related('script_version__blob')
+    if ranked is None:
+        # Belum ada riwayat pengajuan: tampilkan jadwal terdekat.
+        recommended = list(schedules.order_by('date', 'time')[:RECOMMENDATION_LIMIT])
+    else:
+        by_id = schedules.in_bulk(ranked)
+        recommended = [by_id[pk] for pk in ranked if pk in by_id]
+    return render(request, 'schedule/actor_recommended_schedules.html', {
+        'recommended_schedules': recommended,
+        'personalized': ranked is not None,
+        'reminders': [],
+    })
+
+
 @login_required
 def create_schedule(request: HttpRequest) -> HttpResponse:
     user: User = request.user  # type: ignore
@@ -130,6 +224,7 @@ def create_schedule(request: HttpRequest) -> HttpResponse:
             schedule.producer = user
             schedule.status = 'available'
             schedule.save()
+            form.save_script(schedule)
             messages.success(request, 'Jadwal berhasil dibuat.')
             return redirect('producer_dashboard')
         else:
@@ -178,16 +273,20 @@ def complete_schedule(request: HttpRequest, pk: int) -> HttpResponse:
     if user.role != 'producer' or schedule.producer_id != user.id:
         return HttpResponseForbidden('Tidak memiliki izin untuk menandai selesai.')
     schedule.status = 'completed'
-    schedule.save(update_fields=['status'])
+    schedule.save(update_fields=['status', 'updated_at'])
     messages.success(request, 'Jadwal ditandai sebagai selesai.')
     return redirect('producer_dashboard')
 
 
 @login_required
+@throttle('join')
 def join_schedule(request: HttpRequest, pk: int) -> HttpResponse:
     user: User = request.user  # type: ignore
     if user.role != 'actor':
         return HttpResponseForbidden('Hanya aktor yang dapat mengajukan jadwal.')
+    if request.method != 'POST':
+        # Hanya lewat form POST: GET tidak boleh membuat pengajuan (dan tidak melewati throttle).
+        return redirect('actor_available_schedules')
     schedule = get_object_or_404(ShootingSchedule, pk=pk)
     # Cek sudah apply
     existing = ScheduleApplication.objects.filter(schedule=schedule, actor=user).first()
@@ -197,8 +296,7 @@ def join_schedule(request: HttpRequest, pk: int) -> HttpResponse:
     if schedule.status != 'available':
         messages.error(request, 'Pendaftaran jadwal sudah ditutup atau selesai.')
         return redirect('actor_available_schedules')
-    ScheduleApplication.objects.create(schedule=schedule, actor=user, status='pending')
-    Notification.objects.create(user=schedule.producer, schedule=schedule, message=f'Aktor {user.get_full_name() or user.username} mengajukan untuk bergabung jadwal "{schedule.title}".')
+    actions.apply_to_schedule(schedule, user)
     messages.success(request, 'Pengajuan bergabung dikirim. Mohon tunggu konfirmasi produser.')
     return redirect('actor_my_schedules')
 
@@ -206,11 +304,11 @@ def join_schedule(request: HttpRequest, pk: int) -> HttpResponse:
 @login_required
 def leave_schedule(request: HttpRequest, pk: int) -> HttpResponse:
     user: User = request.user  # type: ignore
-    app = get_object_or_404(ScheduleApplication, schedule_id=pk, actor=user)
+    app = get_object_or_404(ScheduleApplication.objects.select_related('schedule'), schedule_id=pk, actor=user)
     if app.status != 'pending':
         messages.error(request, 'Tidak dapat membatalkan jika status sudah dikonfirmasi/ditolak.')
         return redirect('actor_my_schedules')
-    app.delete()
+    actions.withdraw_application(app)
     messages.info(request, 'Pengajuan telah dibatalkan.')
     return redirect('actor_my_schedules')
 
@@ -220,15 +318,12 @@ def approve_application(request: HttpRequest, app_id: int) -> HttpResponse:
     user: User = request.user  # type: ignore
     if user.role != 'producer':
         return HttpResponseForbidden('Hanya produser yang dapat mengelola pengajuan.')
-    application = get_object_or_404(ScheduleApplication, id=app_id)
+    application = get_object_or_404(ScheduleApplication.objects.select_related('schedule'), id=app_id)
     if application.schedule.producer_id != user.id:
         return HttpResponseForbidden('Tidak memiliki izin untuk pengajuan ini.')
     if request.method != 'POST':
         return redirect('producer_dashboard')
-    application.status = 'confirmed'
-    application.responded_at = timezone.now()
-    application.save(update_fields=['status', 'responded_at'])
-    Notification.objects.create(user=application.actor, schedule=application.schedule, message=f'Pengajuan Anda pada "{application.schedule.title}" diterima.')
+    actions.respond_to_application(application, 'confirmed')
     messages.success(request, 'Pengajuan diterima.')
     return redirect('producer_dashboard')
 
@@ -237,15 +332,12 @@ def reject_application(request: HttpRequest, app_id: int) -> HttpResponse:
     user: User = request.user  # type: ignore
     if user.role != 'producer':
         return HttpResponseForbidden('Hanya produser yang dapat mengelola pengajuan.')
-    application = get_object_or_404(ScheduleApplication, id=app_id)
+    application = get_object_or_404(ScheduleApplication.objects.select_related('schedule'), id=app_id)
     if application.schedule.producer_id != user.id:
         return HttpResponseForbidden('Tidak memiliki izin untuk pengajuan ini.')
     if request.method != 'POST':
         return redirect('producer_dashboard')
-    application.status = 'rejected'
-    application.responded_at = timezone.now()
-    application.save(update_fields=['status', 'responded_at'])
-    Notification.objects.create(user=application.actor, schedule=application.schedule, message=f'Pengajuan Anda pada "{application.schedule.title}" ditolak.')
+    actions.respond_to_application(application, 'rejected')
     messages.info(request, 'Pengajuan ditolak.')
     return redirect('producer_dashboard')
 
@@ -258,7 +350,7 @@ def close_schedule(request: HttpRequest, pk: int) -> HttpResponse:
     if request.method != 'POST':
         return redirect('producer_dashboard')
     schedule.status = 'closed'
-    schedule.save(update_fields=['status'])
+    schedule.save(update_fields=['status', 'updated_at'])
     messages.info(request, 'Pendaftaran jadwal ditutup.')
     return redirect('producer_dashboard')
 
@@ -281,11 +373,12 @@ def complete_social_task(request: HttpRequest, task_id: int) -> HttpResponse:
     user: User = request.user  # type: ignore
     if user.role != 'editor':
         return HttpResponseForbidden('Hanya editor yang dapat menyelesaikan task.')
-    task = get_object_or_404(SocialMediaTask, id=task_id, editor=user)
+    task = get_object_or_404(SocialMediaTask.objects.select_related('schedule'), id=task_id, editor=user)
     if request.method != 'POST':
         return redirect('editor_dashboard')
-    task.is_completed = True
-    task.completed_at = timezone.now()
-    task.save(update_fields=['is_completed', 'completed_at'])
+    if task.is_completed:
+        messages.info(request, 'Task sudah ditandai selesai.')
+        return redirect('editor_dashboard')
+    actions.complete_task(task)
     messages.success(request, 'Task ditandai sebagai selesai.')
     return redirect('editor_dashboard')
@@ -75,3 +75,11 @@ AUTH_USER_MODEL = 'schedule.User'
 LOGIN_URL = 'login'
 LOGIN_REDIRECT_URL = 'dashboard'
 LOGOUT_REDIRECT_URL = 'login'
+
+# Rate limiting (schedule/throttling.py): token bucket per IP dan per user,
+# disimpan di cache berikut (fallback ke memori proses jika cache gagal).
+# Untuk banyak worker, arahkan ke cache bersama (mis. Redis/Memcached).
+# Batas default ada di schedule/throttling.py (DEFAULT_RATES, DEFAULT_CONCURRENCY);
+# definisikan THROTTLE_RATES / THROTTLE_CONCURRENCY di sini hanya untuk menimpanya.
+THROTTLE_CACHE_ALIAS = 'default'
+THROTTLE_TRUST_X_FORWARDED_FOR = False